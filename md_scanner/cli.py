@@ -9,6 +9,7 @@ from md_scanner.embeddings import EmbeddingEngine
 from md_scanner.clustering import ClusteringEngine
 from md_scanner.timeline import TimelineEngine
 from md_scanner.search import SearchEngine
+from md_scanner.keyword_index import KeywordIndex
 
 INDEX_DIR = Path.home() / '.md_index'
 
@@ -38,7 +39,8 @@ def scan(directory, index_dir):
 
 @cli.command()
 @click.option('--index-dir', default=str(INDEX_DIR), help='Index directory')
-def embed(index_dir):
+@click.option('--int8', is_flag=True, help='Store embeddings quantized to int8')
+def embed(index_dir, int8):
     """Generate embeddings for indexed files."""
     scanner = FileScanner(index_dir)
     files = scanner.load_index()
@@ -49,21 +51,33 @@ def embed(index_dir):
 
     click.echo(f"Generating embeddings for {len(files)} files...")
 
-    engine = EmbeddingEngine(index_dir=index_dir)
+    engine = EmbeddingEngine(
+        index_dir=index_dir, storage_dtype='int8' if int8 else 'float16'
+    )
     file_paths = [f.path for f in files]
 
     with tqdm(total=len(file_paths)) as pbar:
         def progress_update(current, total):
-            pbar.update(1)
+            pbar.update(current - pbar.n)
 
-        engine.generate_embeddings(file_paths, progress_callback=progress_update)
+        cached, generated = engine.generate_embeddings(
+            file_paths, progress_callback=progress_update
+        )
 
+    click.echo(f"Generated {generated} embeddings, reused {cached} unchanged")
     click.echo(f"Embeddings saved to {engine.embeddings_file}")
 
+    keyword_index = KeywordIndex(index_dir)
+    keyword_index.build(file_paths)
+    click.echo(f"Keyword index saved to {keyword_index.index_file}")
+
 @cli.command()
 @click.option('--index-dir', default=str(INDEX_DIR), help='Index directory')
 @click.option('--num-clusters', type=int, default=None, help='Number of clusters')
-def cluster(index_dir, num_clusters):
+@click.option('--quality', is_flag=True, help='Report cluster quality score (slower)')
+@click.option('--reorder-by-cluster/--keep-order', default=True,
+              help='Store embeddings grouped by cluster for faster scans')
+def cluster(index_dir, num_clusters, quality, reorder_by_cluster):
     """Cluster files into semantic groups."""
     embedding_engine = EmbeddingEngine(index_dir=index_dir)
 
@@ -79,12 +93,16 @@ def cluster(index_dir, num_clusters):
         click.echo(f"  {message}")
 
     clusters = clustering_engine.cluster(
-        embedding_engine.embeddings,
+        embedding_engine.dense_embeddings(),
         embedding_engine.file_paths,
         n_clusters=num_clusters,
-        progress_callback=progress_update
+        progress_callback=progress_update,
+        compute_quality=quality
     )
 
+    if reorder_by_cluster and clustering_engine.order is not None:
+        embedding_engine.reorder(clustering_engine.order)
+
     click.echo(f"\nCreated {len(clusters)} clusters:")
     for summary in clustering_engine.list_clusters():
         click.echo(
@@ -1,29 +1,55 @@
 """
 Semantic clustering of markdown files.
 """
-import json
+import functools
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans, kmeans_plusplus
 from sklearn.metrics import davies_bouldin_score
+from md_scanner import jsonio
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_assign():
+    """
+    The Numba assignment kernel, imported (and compiled) by the first
+    use_numba clustering run, or None without numba.
+    """
+    try:
+        from md_scanner.clustering_kernels import assign_nearest
+    except ImportError:
+        return None
+    return assign_nearest
+
 
 class ClusteringEngine:
     """Clusters files into semantic groups."""
 
+    # Corpus size above which FAISS K-means is used when installed
+    FAISS_MIN_VECTORS = 10000
+
     def __init__(self, index_dir: Optional[str] = None):
         """Initialize clustering engine."""
         self.index_dir = Path(index_dir) if index_dir else Path.home() / '.md_index'
         self.index_dir.mkdir(parents=True, exist_ok=True)
         self.clusters_file = self.index_dir / 'clusters.json'
         self.clusters = None
+        self.order = None  # Row permutation that makes each cluster contiguous
 
     def cluster(
         self,
         embeddings: np.ndarray,
         file_paths: List[str],
         n_clusters: Optional[int] = None,
-        progress_callback=None
+        progress_callback=None,
+        compute_quality: bool = False,
+        use_numba: bool = False
     ) -> Dict[int, List[str]]:
         """
         Cluster files into semantic groups.
@@ -33,6 +59,9 @@ class ClusteringEngine:
             file_paths: List of file paths corresponding to embeddings
             n_clusters: Number of clusters (auto-estimated if None)
             progress_callback: Optional callback(stage, message)
+            compute_quality: Report the Davies-Bouldin score (an extra O(N*k*d) pass)
+            use_numba: Run Lloyd iterations with the Numba assignment kernel
+                (BLAS assignment if numba is not installed)
 
         Returns:
             Dict mapping cluster_id to list of file_paths
@@ -49,26 +78,131 @@ class ClusteringEngine:
         # Ensure n_clusters doesn't exceed number of files
         n_clusters = min(n_clusters, len(embeddings))
 
-        # Perform K-means clustering
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(embeddings)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        labels = self._fit_labels(embeddings, n_clusters, use_numba)
 
-        if progress_callback:
+        if compute_quality and progress_callback:
             score = davies_bouldin_score(embeddings, labels)
             progress_callback("clustering", f"Cluster quality score: {score:.3f}")
 
-        # Group files by cluster
-        clusters = {}
-        for label, file_path in zip(labels, file_paths):
-            cluster_id = int(label)
-            if cluster_id not in clusters:
-                clusters[cluster_id] = []
-            clusters[cluster_id].append(file_path)
+        # Group files by cluster: stable sort by label, then slice at label changes
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        sorted_paths = [file_paths[i] for i in order]
+        bounds = np.r_[0, np.flatnonzero(np.diff(sorted_labels)) + 1, len(order)]
+        clusters = {
+            int(sorted_labels[start]): sorted_paths[start:end]
+            for start, end in zip(bounds[:-1], bounds[1:])
+        }
 
         self.clusters = clusters
+        self.order = order
         self.save_clusters()
         return clusters
 
+    def _fit_labels(
+        self,
+        embeddings: np.ndarray,
+        n_clusters: int,
+        use_numba: bool = False
+    ) -> np.ndarray:
+        """
+        Run K-means and return a cluster label per row.
+
+        Large corpora use FAISS (SIMD distance kernels, multithreaded
+        assignment) when available; otherwise mini-batch K-means, where each
+        iteration only touches a sample of the rows.
+        """
+        if use_numba:
+            return self._lloyd(embeddings, n_clusters, use_numba=_numba_assign() is not None)
+
+        if faiss is not None and len(embeddings) >= self.FAISS_MIN_VECTORS:
+            kmeans = faiss.Kmeans(
+                embeddings.shape[1], n_clusters, niter=20, nredo=1, seed=42, verbose=False
+            )
+            kmeans.train(embeddings)
+            _, labels = kmeans.index.search(embeddings, 1)
+            return labels.ravel()
+
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            init='k-means++',
+            n_init=3,
+            batch_size=4096,
+            max_iter=100,
+            reassignment_ratio=0.01,
+            random_state=42
+        )
+        return kmeans.fit_predict(embeddings)
+
+    def _lloyd(
+        self,
+        embeddings: np.ndarray,
+        n_clusters: int,
+        use_numba: bool = True,
+        max_iter: int = 50,
+        tol: float = 1e-4
+    ) -> np.ndarray:
+        """
+        Lloyd's K-means with a pluggable assignment step.
+
+        Args:
+            embeddings: (N, D) float32 contiguous embeddings
+            n_clusters: Number of clusters
+            use_numba: Assign with the Numba kernel instead of BLAS
+            max_iter: Maximum assignment/update rounds
+            tol: Stop once no centroid moves more than this
+
+        Returns:
+            Cluster label per row
+        """
+        centroids, _ = kmeans_plusplus(embeddings, n_clusters, random_state=42)
+        centroids = centroids.astype(np.float32)
+        labels = np.empty(len(embeddings), dtype=np.int64)
+
+        for _ in range(max_iter):
+            self._assign(embeddings, centroids, labels, use_numba)
+
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, embeddings)
+            counts = np.bincount(labels, minlength=n_clusters)
+
+            # Empty clusters keep their previous centroid
+            updated = centroids.copy()
+            filled = counts > 0
+            updated[filled] = sums[filled] / counts[filled, None]
+
+            shift = np.abs(updated - centroids).max()
+            centroids = updated
+            if shift < tol:
+                break
+
+        self._assign(embeddings, centroids, labels, use_numba)
+        return labels
+
+    def _assign(
+        self,
+        embeddings: np.ndarray,
+        centroids: np.ndarray,
+        labels: np.ndarray,
+        use_numba: bool
+    ) -> None:
+        """
+        Write the nearest centroid index for each embedding into labels.
+
+        The BLAS path uses ||x - c||^2 = ||x||^2 + ||c||^2 - 2x.c; ||x||^2 is
+        constant per row, so argmin distance is argmax of x.c - ||c||^2 / 2,
+        computed with one matrix product.
+        """
+        if use_numba:
+            _numba_assign()(embeddings, centroids, labels)
+            return
+
+        c_norm_half = 0.5 * np.einsum('ij,ij->i', centroids, centroids)
+        scores = embeddings @ centroids.T
+        scores -= c_norm_half
+        labels[:] = scores.argmax(axis=1)
+
     def get_cluster_summary(self, cluster_id: int, max_files: int = 5) -> Dict:
         """
         Get summary of a cluster.
@@ -91,7 +225,7 @@ class ClusteringEngine:
         }
 
     def save_clusters(self) -> None:
-        """Save cluster assignments to disk."""
+        """Save cluster assignments to disk as compact JSON."""
         if not self.clusters:
             return
 
@@ -100,8 +234,7 @@ class ClusteringEngine:
             'clusters': {str(k): v for k, v in self.clusters.items()}
         }
 
-        with open(self.clusters_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.clusters_file.write_bytes(jsonio.dumps(data))
 
     def load_clusters(self) -> bool:
         """Load cluster assignments from disk. Returns True if successful."""
@@ -109,8 +242,7 @@ class ClusteringEngine:
             return False
 
         try:
-            with open(self.clusters_file, 'r') as f:
-                data = json.load(f)
+            data = jsonio.loads(self.clusters_file.read_bytes())
             self.clusters = {int(k): v for k, v in data['clusters'].items()}
             return True
         except Exception:
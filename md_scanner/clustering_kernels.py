@@ -0,0 +1,81 @@
+"""
+Numba kernels for K-means cluster assignment.
+
+Importing this module requires numba; ClusteringEngine treats ImportError
+as "kernels unavailable" and runs the Lloyd assignment step with BLAS
+(ClusteringEngine._assign) instead.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def assign(X: np.ndarray, C: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write the index of the nearest centroid for each row of X into out.
+
+    The running squared distance to a centroid is abandoned as soon as it
+    exceeds the best distance found so far, so far-away centroids usually
+    cost only a fraction of the dimensions.
+
+    Args:
+        X: (N, D) float32 embeddings
+        C: (K, D) float32 centroids
+        out: (N,) int64 array receiving labels
+    """
+    N, D = X.shape
+    K = C.shape[0]
+    for i in prange(N):
+        best = 1e30
+        best_k = 0
+        for k in range(K):
+            s = 0.0
+            for d in range(D):
+                diff = X[i, d] - C[k, d]
+                s += diff * diff
+                if s > best:
+                    break
+            if s < best:
+                best = s
+                best_k = k
+        out[i] = best_k
+
+
+# Output dimension of the default all-MiniLM-L6-v2 model
+D384 = 384
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def assign_d384(X: np.ndarray, C: np.ndarray, out: np.ndarray) -> None:
+    """
+    assign() specialized for 384-dimensional embeddings.
+
+    The inner loop has a constant trip count of 32, so LLVM can fully unroll
+    and vectorize each block; the early-exit check runs once per block instead of per
+    dimension so it does not stop vectorization.
+    """
+    N = X.shape[0]
+    K = C.shape[0]
+    for i in prange(N):
+        best = 1e30
+        best_k = 0
+        for k in range(K):
+            s = 0.0
+            for b in range(0, 384, 32):
+                for j in range(32):
+                    diff = X[i, b + j] - C[k, b + j]
+                    s += diff * diff
+                if s > best:
+                    break
+            if s < best:
+                best = s
+                best_k = k
+        out[i] = best_k
+
+
+def assign_nearest(X: np.ndarray, C: np.ndarray, out: np.ndarray) -> None:
+    """Run the 384-dim kernel when it applies, otherwise the generic one."""
+    if X.shape[1] == D384:
+        assign_d384(X, C, out)
+    else:
+        assign(X, C, out)
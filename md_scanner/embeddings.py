@@ -1,35 +1,119 @@
 """
 Embedding generation and semantic search.
 """
-import pickle
+import functools
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Set
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_topk():
+    """
+    The Numba top-k kernel, imported (and compiled) by the first exact
+    search, or None without numba; importing numba takes about half a
+    second, which commands that never search shouldn't pay.
+    """
+    try:
+        from md_scanner.search_kernels import topk
+    except ImportError:
+        return None
+    return topk
+
 
 class EmbeddingEngine:
     """Generates and manages embeddings for semantic search."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", index_dir: Optional[str] = None):
+    # On-disk vector formats; int8 stores a float32 scale per row
+    STORAGE_DTYPES = ('float16', 'int8')
+
+    # Rows converted to float32 at a time when scoring stored embeddings
+    SEARCH_CHUNK_ROWS = 65536
+
+    # Corpus size from which an HNSW graph is built and searched when hnswlib
+    # is installed; smaller corpora are scanned exactly
+    ANN_MIN_VECTORS = 50000
+
+    # HNSW build and query parameters
+    ANN_M = 16
+    ANN_EF_CONSTRUCTION = 200
+    ANN_EF_SEARCH = 128
+
+    # Query embeddings remembered for repeated queries
+    QUERY_CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        index_dir: Optional[str] = None,
+        batch_size: int = 64,
+        read_workers: int = 32,
+        storage_dtype: str = 'float16'
+    ):
         """
         Initialize embedding engine.
 
         Args:
             model_name: HuggingFace model name (default is lightweight and fast)
             index_dir: Directory to cache embeddings
+            batch_size: Number of documents encoded per model call
+            read_workers: Maximum file reads kept in flight during extraction
+            storage_dtype: 'float16' or 'int8' (quarter of float32 size, per-row scale)
         """
-        self.model = SentenceTransformer(model_name)
+        if storage_dtype not in self.STORAGE_DTYPES:
+            raise ValueError(f"Unsupported storage dtype: {storage_dtype}")
+
+        self.model_name = model_name
+        self._model = None
+        self.batch_size = batch_size
+        self.read_workers = read_workers
+        self.storage_dtype = storage_dtype
         self.index_dir = Path(index_dir) if index_dir else Path.home() / '.md_index'
         self.index_dir.mkdir(parents=True, exist_ok=True)
-        self.embeddings_file = self.index_dir / 'embeddings.pkl'
+        self.embeddings_file = self.index_dir / 'embeddings.npy'
+        self.paths_file = self.index_dir / 'paths.json'
+        self.hashes_file = self.index_dir / 'content_hashes.json'
+        self.scales_file = self.index_dir / 'embedding_scales.npy'
+        self.ann_file = self.index_dir / 'hnsw.bin'
         self.embeddings = None
+        self.embedding_scales = None
         self.file_paths = None
+        self.content_hashes = None
+        self.content_hashes_model = None  # model that produced the hashed rows
+        self._ann = None  # hnswlib.Index over the current rows, loaded on first search
+        self._query_embeddings = OrderedDict()  # query -> normalized embedding, LRU order
+
+    @property
+    def model(self):
+        """
+        SentenceTransformer model, loaded on first use.
+
+        Loading the weights (and importing torch) takes seconds, so commands
+        that only read stored embeddings never pay for it.
+        """
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
 
     def _extract_content(self, file_path: str, max_chars: int = 2000) -> str:
         """
         Extract content from markdown file for embedding.
 
+        One unbuffered read of enough bytes for ``max_chars`` characters
+        (UTF-8 uses at most four per character), decoded and newline-translated
+        like a text-mode read, skipping the text-layer buffering of open().
+
         Args:
             file_path: Path to markdown file
             max_chars: Maximum characters to extract
@@ -38,68 +122,342 @@ class EmbeddingEngine:
             Extracted text content
         """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(max_chars)
-            return content.strip()
-        except Exception:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                data = os.read(fd, 4 * max_chars)
+            finally:
+                os.close(fd)
+        except OSError:
             return ""
+        text = data.decode('utf-8', errors='ignore')
+        return text.replace('\r\n', '\n').replace('\r', '\n')[:max_chars].strip()
+
+    def _extract_contents(self, file_paths: List[str]) -> List[str]:
+        """
+        Extract content from many files concurrently, preserving order.
+
+        File reads release the GIL, so a thread pool overlaps their latency.
+        Reads are latency-bound rather than CPU-bound, so the pool is sized by
+        ``read_workers`` (outstanding I/O) instead of the core count; raise it
+        for high-latency network mounts.
+        """
+        if not file_paths:
+            return []
+
+        max_workers = min(self.read_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._extract_content, file_paths))
+
+    def _read_content_hashes(self) -> Tuple[Optional[str], Optional[int], List[str]]:
+        """
+        Read content_hashes.json as (model_name, dimension, hashes).
+
+        Files written before the model was recorded hold a bare list of
+        hashes; their model and dimension are returned as None.
+        """
+        with open(self.hashes_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            return None, None, data
+        return data.get('model'), data.get('dimension'), data['hashes']
+
+    def _load_cached_rows(self) -> Dict[str, np.ndarray]:
+        """
+        Load embeddings from the previous run keyed by content hash.
+
+        Rows are only reused if they were produced by this engine's model;
+        a different model (even one of the same dimension) embeds into an
+        unrelated space.
 
-    def generate_embeddings(self, file_paths: List[str], progress_callback=None) -> None:
+        Returns:
+            Dict mapping content_hash to embedding_row
+        """
+        if not self.hashes_file.exists() or not self.load_embeddings():
+            return {}
+
+        try:
+            model_name, dimension, hashes = self._read_content_hashes()
+        except Exception:
+            return {}
+
+        if model_name != self.model_name or dimension != self.embeddings.shape[1]:
+            return {}
+        if len(hashes) != len(self.file_paths):
+            return {}
+
+        # Copy out of the memory map so the file can be rewritten afterwards
+        return dict(zip(hashes, self.dense_embeddings()))
+
+    def generate_embeddings(
+        self,
+        file_paths: List[str],
+        progress_callback=None
+    ) -> Tuple[int, int]:
         """
         Generate embeddings for all files.
 
+        Contents whose hash the same model embedded in the previous run reuse
+        the stored vector, and identical contents (templates, copies) are
+        encoded once.
+        The remaining unique contents are encoded in batches of
+        ``batch_size`` so the model runs one padded forward pass per batch.
+
         Args:
             file_paths: List of markdown file paths
             progress_callback: Optional callback(current, total) for progress
+
+        Returns:
+            Tuple of (cached_count, generated_count)
         """
-        self.file_paths = file_paths
-        embeddings = []
+        cached_rows = self._load_cached_rows()
+
+        total = len(file_paths)
+        contents = self._extract_contents(file_paths)
+        hashes = [
+            hashlib.sha1(content.encode('utf-8')).hexdigest() for content in contents
+        ]
+
+        embeddings = np.zeros(
+            (total, self.model.get_sentence_embedding_dimension()), dtype=np.float32
+        )
 
-        for i, file_path in enumerate(file_paths):
-            content = self._extract_content(file_path)
-            if content:
-                embedding = self.model.encode(content, normalize_embeddings=True)
-                embeddings.append(embedding)
+        # Empty files keep a zero vector; known contents reuse their old row
+        pending: Dict[str, List[int]] = {}
+        cached_count = 0
+        for i, (content, content_hash) in enumerate(zip(contents, hashes)):
+            if not content:
+                continue
+            cached = cached_rows.get(content_hash)
+            if cached is not None and len(cached) == embeddings.shape[1]:
+                embeddings[i] = cached
+                cached_count += 1
             else:
-                # Use a zero vector for empty files
-                embeddings.append(np.zeros(384))
+                pending.setdefault(content_hash, []).append(i)
+
+        groups = list(pending.values())
+        generated_count = sum(len(rows) for rows in groups)
+        done = total - generated_count
+
+        for start in range(0, len(groups), self.batch_size):
+            batch = groups[start:start + self.batch_size]
+            vectors = self.model.encode(
+                [contents[rows[0]] for rows in batch],
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            for rows, vector in zip(batch, vectors):
+                embeddings[rows] = vector
 
             if progress_callback:
-                progress_callback(i + 1, len(file_paths))
+                done += sum(len(rows) for rows in batch)
+                progress_callback(done, total)
+
+        if progress_callback and not groups:
+            progress_callback(total, total)
 
-        self.embeddings = np.array(embeddings)
+        self.file_paths = file_paths
+        self.embeddings = embeddings
+        self.embedding_scales = None
+        self.content_hashes = hashes
+        self.content_hashes_model = self.model_name
         self.save_embeddings()
 
+        return cached_count, generated_count
+
     def save_embeddings(self) -> None:
-        """Save embeddings to disk."""
-        data = {
-            'embeddings': self.embeddings,
-            'file_paths': self.file_paths
-        }
-        with open(self.embeddings_file, 'wb') as f:
-            pickle.dump(data, f)
+        """
+        Save embeddings to disk.
+
+        Vectors are stored as a float16 (or int8 plus per-row scale) .npy file
+        so they can be memory-mapped on load; file paths and content hashes
+        go to JSON sidecars.
+        """
+        # Freshly generated float32 matrices are written without an extra copy
+        if self.embedding_scales is None:
+            embeddings = np.asarray(self.embeddings, dtype=np.float32)
+        else:
+            embeddings = self.dense_embeddings()
+
+        if self.storage_dtype == 'int8':
+            scales = np.abs(embeddings).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            np.save(self.embeddings_file, np.round(embeddings / scales[:, None]).astype(np.int8))
+            np.save(self.scales_file, scales.astype(np.float32))
+        else:
+            np.save(self.embeddings_file, embeddings.astype(np.float16))
+
+        with open(self.paths_file, 'w', encoding='utf-8') as f:
+            json.dump(self.file_paths, f)
+        if self.content_hashes is not None:
+            hashes = {
+                'model': self.content_hashes_model,
+                'dimension': embeddings.shape[1],
+                'hashes': self.content_hashes
+            }
+            with open(self.hashes_file, 'w', encoding='utf-8') as f:
+                json.dump(hashes, f)
+
+        self._save_ann(embeddings)
+
+    def _save_ann(self, embeddings: np.ndarray) -> None:
+        """
+        Build and save an HNSW graph over the rows (labels are row indices),
+        or remove a stale one when the corpus is small or hnswlib is missing.
+        """
+        self._ann = None
+        if hnswlib is None or len(embeddings) < self.ANN_MIN_VECTORS:
+            if self.ann_file.exists():
+                self.ann_file.unlink()
+            return
+
+        # Stored vectors are L2-normalized, so inner product ranks by cosine
+        ann = hnswlib.Index(space='ip', dim=embeddings.shape[1])
+        ann.init_index(
+            max_elements=len(embeddings),
+            ef_construction=self.ANN_EF_CONSTRUCTION,
+            M=self.ANN_M
+        )
+        ann.add_items(embeddings, np.arange(len(embeddings)))
+        ann.save_index(str(self.ann_file))
+        self._ann = ann
+
+    def _load_ann(self):
+        """Return the HNSW graph for the loaded rows, or None to search exactly."""
+        if self._ann is None and hnswlib is not None and self.ann_file.exists():
+            try:
+                ann = hnswlib.Index(space='ip', dim=self.embeddings.shape[1])
+                ann.load_index(str(self.ann_file), max_elements=len(self.embeddings))
+                if ann.get_current_count() == len(self.embeddings):
+                    self._ann = ann
+            except Exception:
+                pass
+        return self._ann
 
     def load_embeddings(self) -> bool:
         """Load embeddings from disk. Returns True if successful."""
-        if not self.embeddings_file.exists():
+        if not self.embeddings_file.exists() or not self.paths_file.exists():
             return False
 
         try:
-            with open(self.embeddings_file, 'rb') as f:
-                data = pickle.load(f)
-            self.embeddings = data['embeddings']
-            self.file_paths = data['file_paths']
+            self._ann = None
+            self.embeddings = np.load(self.embeddings_file, mmap_mode='r')
+            self.embedding_scales = (
+                np.load(self.scales_file) if self.embeddings.dtype == np.int8 else None
+            )
+            with open(self.paths_file, 'r', encoding='utf-8') as f:
+                self.file_paths = json.load(f)
             return True
         except Exception:
             return False
 
-    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+    def stored_count(self) -> int:
+        """
+        Number of stored embeddings, read from the .npy header alone.
+
+        Cheaper than load_embeddings when only the count is needed, and holds
+        no memory map open afterwards.
+        """
+        if not self.embeddings_file.exists():
+            return 0
+
+        with open(self.embeddings_file, 'rb') as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, _ = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, _ = np.lib.format.read_array_header_2_0(f)
+        return shape[0] if shape else 0
+
+    def reorder(self, order: np.ndarray) -> None:
+        """
+        Permute stored rows and save, e.g. so each cluster is contiguous.
+
+        Scans that touch one cluster's rows then read a contiguous region of
+        the memory map instead of pages scattered across the file.
+
+        Args:
+            order: Permutation of row indices (ClusteringEngine.order)
+        """
+        if self.content_hashes is None and self.hashes_file.exists():
+            # Keep the recorded model: these rows were not made by this engine
+            self.content_hashes_model, _, self.content_hashes = self._read_content_hashes()
+
+        if self.embedding_scales is not None:
+            self.storage_dtype = 'int8'  # Keep the stored format
+
+        self.embeddings = self.dense_embeddings()[order]
+        self.embedding_scales = None
+        self.file_paths = [self.file_paths[i] for i in order]
+
+        if self.content_hashes is not None and len(self.content_hashes) == len(order):
+            self.content_hashes = [self.content_hashes[i] for i in order]
+        else:
+            # Hashes can no longer be matched to rows
+            self.content_hashes = None
+            if self.hashes_file.exists():
+                self.hashes_file.unlink()
+
+        self.save_embeddings()
+
+    def dense_embeddings(self) -> np.ndarray:
+        """Return embeddings as an in-memory float32 matrix (dequantized if int8)."""
+        embeddings = np.array(self.embeddings, dtype=np.float32)
+        if self.embedding_scales is not None:
+            embeddings *= self.embedding_scales[:, None]
+        return embeddings
+
+    def _similarities(self, query_embedding: np.ndarray) -> np.ndarray:
+        """
+        Dot product of every stored embedding with the query.
+
+        Stored rows are converted to float32 one chunk at a time, so int8 and
+        float16 matrices are streamed through BLAS without materializing a
+        full float32 copy.
+        """
+        query = np.asarray(query_embedding, dtype=np.float32)
+        similarities = np.empty(len(self.embeddings), dtype=np.float32)
+
+        for start in range(0, len(self.embeddings), self.SEARCH_CHUNK_ROWS):
+            block = self.embeddings[start:start + self.SEARCH_CHUNK_ROWS]
+            similarities[start:start + len(block)] = block.astype(np.float32) @ query
+
+        if self.embedding_scales is not None:
+            similarities *= self.embedding_scales
+        return similarities
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """
+        L2-normalized embedding of a query.
+
+        The most recent QUERY_CACHE_SIZE queries are remembered, so repeating
+        one skips the model forward pass.
+        """
+        cache = self._query_embeddings
+        embedding = cache.get(query)
+        if embedding is None:
+            embedding = self.model.encode(query, normalize_embeddings=True)
+            cache[query] = embedding
+            if len(cache) > self.QUERY_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(query)
+        return embedding
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        allowed_paths: Optional[Set[str]] = None
+    ) -> List[Tuple[str, float]]:
         """
         Find files similar to query.
 
         Args:
             query: Search query
             top_k: Number of results to return
+            allowed_paths: If given, only these files are scored
 
         Returns:
             List of (file_path, similarity_score) tuples
@@ -107,15 +465,87 @@ class EmbeddingEngine:
         if self.embeddings is None or self.file_paths is None:
             raise ValueError("Embeddings not loaded. Call load_embeddings() or generate_embeddings()")
 
-        query_embedding = self.model.encode(query, normalize_embeddings=True)
-        similarities = cosine_similarity([query_embedding], self.embeddings)[0]
+        query_embedding = self.encode_query(query)
+
+        rows = None
+        if allowed_paths is not None:
+            rows = np.array(
+                [i for i, path in enumerate(self.file_paths) if path in allowed_paths],
+                dtype=np.int64
+            )
+
+        k = min(top_k, len(self.embeddings) if rows is None else len(rows))
+        if k <= 0:
+            return []
 
-        # Get top-k results
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # A subset of rows is always scanned exactly
+        use_ann = rows is None and len(self.embeddings) >= self.ANN_MIN_VECTORS
+        ann = self._load_ann() if use_ann else None
+        if ann is not None:
+            top_indices, similarities = self._ann_candidates(ann, query_embedding, k)
+        else:
+            top_indices, similarities = self._exact_top_k(query_embedding, k, rows)
 
         results = [
-            (self.file_paths[i], float(similarities[i]))
-            for i in top_indices
+            (self.file_paths[i], float(similarity))
+            for i, similarity in zip(top_indices, similarities)
         ]
 
         return results
+
+    def _row_similarities(
+        self, rows: np.ndarray, query_embedding: np.ndarray
+    ) -> np.ndarray:
+        """Dot product of the stored embeddings at rows (ascending) with the query."""
+        similarities = self.embeddings[rows].astype(np.float32) @ np.asarray(
+            query_embedding, dtype=np.float32
+        )
+        if self.embedding_scales is not None:
+            similarities *= self.embedding_scales[rows]
+        return similarities
+
+    def _exact_top_k(
+        self, query_embedding: np.ndarray, k: int, rows: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every stored row (or only rows) and select the k best, best
+        first.
+        """
+        # Stored vectors are L2-normalized, so cosine similarity is a dot product
+        if rows is None:
+            similarities = self._similarities(query_embedding)
+        else:
+            similarities = self._row_similarities(rows, query_embedding)
+
+        # Select top-k in O(N), then sort only those k
+        topk = _numba_topk()
+        if topk is not None:
+            top_indices, _ = topk(similarities, k)
+        else:
+            top_indices = np.argpartition(similarities, -k)[-k:]
+            top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
+
+        top_similarities = similarities[top_indices]
+        if rows is not None:
+            top_indices = rows[top_indices]
+        return top_indices, top_similarities
+
+    def _ann_candidates(
+        self, ann, query_embedding: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate k nearest rows from the HNSW graph, O(log N) instead of a
+        full scan. Candidates are re-scored against the stored rows so scores
+        match exact search; falls back to it if the graph can't return k.
+        """
+        ann.set_ef(max(self.ANN_EF_SEARCH, k))
+        try:
+            labels, _ = ann.knn_query(np.asarray(query_embedding, dtype=np.float32), k=k)
+        except RuntimeError:
+            return self._exact_top_k(query_embedding, k)
+
+        rows = np.sort(labels[0].astype(np.int64))
+        similarities = self._row_similarities(rows, query_embedding)
+
+        order = np.argsort(similarities)[::-1]
+        return rows[order], similarities[order]
@@ -0,0 +1,39 @@
+"""
+Compact JSON serialization, using orjson when it is installed.
+
+orjson is several times faster than the stdlib json module and returns
+UTF-8 bytes directly; without it the stdlib produces equivalent compact
+output.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize obj to compact UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to serialize (dict keys must be strings)
+        default: Optional fallback for otherwise unserializable values
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(
+        obj, default=default, ensure_ascii=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
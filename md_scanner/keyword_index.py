@@ -0,0 +1,218 @@
+"""
+Persistent inverted index over the heads of markdown files for keyword search.
+"""
+import functools
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+from scipy import sparse
+from md_scanner import jsonio
+
+
+@functools.lru_cache(maxsize=None)
+def _add_capped_counts():
+    """
+    The Numba scoring kernel, imported (and compiled) by the first keyword
+    query, or None without numba.
+    """
+    try:
+        from md_scanner.keyword_kernels import add_capped_counts
+    except ImportError:
+        return None
+    return add_capped_counts
+
+
+# Runs of Unicode word characters; each run is bounded by \b already, so
+# this matches exactly what \b\w+\b does without the boundary checks
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercased text into word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class KeywordIndex:
+    """
+    Term counts for the first HEAD_CHARS characters of every file, plus
+    lowercased file names.
+
+    Counts are held as a sparse files x vocabulary matrix (CSC, so each
+    term's column is contiguous) and scoring a keyword is one sparse
+    product over the columns of the terms containing it. Built once (e.g.
+    after embedding) and saved next to the embeddings, so a query is scored
+    from memory instead of re-reading every file. Like the embeddings, it
+    reflects file contents as of the last build.
+    """
+
+    # Characters of each file that are indexed
+    HEAD_CHARS = 5000
+
+    # Maximum file reads kept in flight while building
+    READ_WORKERS = 32
+
+    # Maximum occurrences counted per keyword and file
+    MAX_OCCURRENCES = 5
+
+    # Keywords whose matching vocabulary columns are remembered
+    MAX_CACHED_KEYWORDS = 1024
+
+    def __init__(self, index_dir: Optional[str] = None):
+        """Initialize keyword index with optional index directory."""
+        self.index_dir = Path(index_dir) if index_dir else Path.home() / '.md_index'
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.index_dir / 'keyword_index.json'
+        self.counts_file = self.index_dir / 'keyword_counts.npz'
+        self.file_paths = None
+        self.terms = None
+        self.counts = None  # (files, terms) sparse.csc_matrix of occurrence counts
+        self._names = None
+        self._term_matches = {}
+
+    def _read_head(self, file_path: str) -> str:
+        """
+        Read the indexed head of a file ('' if it can't be read).
+
+        One unbuffered read of enough bytes for HEAD_CHARS characters (UTF-8
+        uses at most four per character), decoded and newline-translated
+        like a text-mode read.
+        """
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                data = os.read(fd, 4 * self.HEAD_CHARS)
+            finally:
+                os.close(fd)
+        except OSError:
+            return ''
+        text = data.decode('utf-8', errors='ignore')
+        return text.replace('\r\n', '\n').replace('\r', '\n')[:self.HEAD_CHARS]
+
+    def build(self, file_paths: List[str]) -> None:
+        """
+        Index the heads of file_paths and save the index.
+
+        Args:
+            file_paths: Files to index; result scores refer to these paths
+        """
+        term_ids = {}
+        docs, columns, counts = [], [], []
+        # Reads release the GIL, so a thread pool overlaps their latency
+        max_workers = max(1, min(self.READ_WORKERS, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            heads = executor.map(self._read_head, file_paths)
+            for doc, head in enumerate(heads):
+                for term, count in Counter(tokenize(head)).items():
+                    docs.append(doc)
+                    columns.append(term_ids.setdefault(term, len(term_ids)))
+                    counts.append(count)
+
+        self.file_paths = list(file_paths)
+        self.terms = list(term_ids)
+        self.counts = sparse.csc_matrix(
+            (
+                np.array(counts, dtype=np.int32),
+                (np.array(docs, dtype=np.int64), np.array(columns, dtype=np.int64))
+            ),
+            shape=(len(self.file_paths), len(self.terms))
+        )
+        self._reset_lookups()
+        self.save()
+
+    def save(self) -> None:
+        """Save the counts as .npz arrays and paths and terms as compact JSON."""
+        np.savez(
+            self.counts_file,
+            data=self.counts.data,
+            indices=self.counts.indices,
+            indptr=self.counts.indptr
+        )
+        data = {'paths': self.file_paths, 'terms': self.terms}
+        self.index_file.write_bytes(jsonio.dumps(data))
+
+    def load(self) -> bool:
+        """Load the index from disk. Returns True if successful."""
+        if not self.index_file.exists() or not self.counts_file.exists():
+            return False
+
+        try:
+            data = jsonio.loads(self.index_file.read_bytes())
+            with np.load(self.counts_file) as arrays:
+                counts = sparse.csc_matrix(
+                    (arrays['data'], arrays['indices'], arrays['indptr']),
+                    shape=(len(data['paths']), len(data['terms']))
+                )
+            self.file_paths = data['paths']
+            self.terms = data['terms']
+            self.counts = counts
+            self._reset_lookups()
+            return True
+        except Exception:
+            return False
+
+    def _reset_lookups(self) -> None:
+        """Derive the per-query lookup structures from a new index."""
+        self._names = np.array(
+            [os.path.basename(path).lower() for path in self.file_paths], dtype=str
+        )
+        self._term_matches = {}
+
+    def _terms_containing(self, keyword: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Columns of the vocabulary terms that contain keyword, and how many
+        times each contains it.
+        """
+        matches = self._term_matches.get(keyword)
+        if matches is None:
+            if len(self._term_matches) >= self.MAX_CACHED_KEYWORDS:
+                self._term_matches.clear()
+            columns = [i for i, term in enumerate(self.terms) if keyword in term]
+            matches = (
+                np.array(columns, dtype=np.int64),
+                np.array([self.terms[i].count(keyword) for i in columns], dtype=np.int64)
+            )
+            self._term_matches[keyword] = matches
+        return matches
+
+    def score(self, keywords: List[str]) -> np.ndarray:
+        """
+        Score indexed files against keywords.
+
+        Each keyword adds 2.0 if it occurs in the lowercased file name, plus
+        its number of occurrences in the head (capped at MAX_OCCURRENCES).
+        Keywords are word characters only, so every occurrence lies inside
+        one token and is counted from the columns of the terms containing
+        it, by the numba kernel when available.
+
+        Args:
+            keywords: Lowercased query keywords
+
+        Returns:
+            (len(file_paths),) float64 scores aligned with file_paths
+        """
+        scores = np.zeros(len(self.file_paths), dtype=np.float64)
+        add_capped_counts = _add_capped_counts() if keywords else None
+        if add_capped_counts is not None:
+            scratch = np.zeros(len(self.file_paths), dtype=np.int64)
+        for keyword in keywords:
+            scores += 2.0 * (np.char.find(self._names, keyword) >= 0)
+
+            columns, occurrences = self._terms_containing(keyword)
+            if not len(columns):
+                continue
+            if add_capped_counts is not None:
+                counts = self.counts
+                add_capped_counts(
+                    counts.indptr, counts.indices, counts.data, columns, occurrences,
+                    self.MAX_OCCURRENCES, scratch, scores
+                )
+            else:
+                scores += np.minimum(
+                    self.counts[:, columns] @ occurrences, self.MAX_OCCURRENCES
+                )
+
+        return scores
@@ -0,0 +1,62 @@
+"""
+Numba kernels for keyword scoring.
+
+Importing this module requires numba; KeywordIndex treats ImportError
+as "kernels unavailable" and scores with scipy sparse products.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def add_capped_counts(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    data: np.ndarray,
+    columns: np.ndarray,
+    occurrences: np.ndarray,
+    cap: int,
+    counts: np.ndarray,
+    scores: np.ndarray
+) -> None:
+    """
+    Add one keyword's capped occurrence counts to scores.
+
+    Walks the CSC columns of the terms containing the keyword, summing
+    term count x occurrences per file into counts, then adds min(count,
+    cap) for each touched file and zeroes its counter again. Only the
+    nonzeros of those columns are visited.
+
+    Args:
+        indptr, indices, data: CSC arrays of the (files, terms) count matrix
+        columns: (M,) columns of the terms containing the keyword
+        occurrences: (M,) occurrences of the keyword in each of those terms
+        cap: Maximum contribution per file
+        counts: (files,) int64 scratch, all zero on entry and on return
+        scores: (files,) float64 scores updated in place
+    """
+    for j in range(columns.shape[0]):
+        column = columns[j]
+        for pos in range(indptr[column], indptr[column + 1]):
+            counts[indices[pos]] += data[pos] * occurrences[j]
+
+    for j in range(columns.shape[0]):
+        column = columns[j]
+        for pos in range(indptr[column], indptr[column + 1]):
+            row = indices[pos]
+            if counts[row]:
+                scores[row] += min(counts[row], cap)
+                counts[row] = 0
+
+
+# Compile (or load from cache) when first imported, ahead of the first real query
+add_capped_counts(
+    np.array([0, 1], dtype=np.int32),
+    np.array([0], dtype=np.int32),
+    np.array([1], dtype=np.int32),
+    np.array([0], dtype=np.int64),
+    np.array([1], dtype=np.int64),
+    5,
+    np.zeros(1, dtype=np.int64),
+    np.zeros(1, dtype=np.float64)
+)
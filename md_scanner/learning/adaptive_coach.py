@@ -15,17 +15,51 @@ Key responsibilities:
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
-import json
+from typing import Deque, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from collections import deque
+import atexit
+import bisect
+import copy
+import itertools
 import os
+import sys
+import time
 
-from .behavior_tracker import BehaviorTracker
-from .difficulty_detector import DifficultyDetector, DifficultyReport, SkillAssessment
-from .suggestion_engine import SuggestionEngine, NamingSuggestion, FolderSuggestion
+from .. import jsonio
 
+if TYPE_CHECKING:
+    from .behavior_tracker import BehaviorTracker
+    from .difficulty_detector import DifficultyDetector, DifficultyReport, SkillAssessment
+    from .suggestion_engine import SuggestionEngine
 
-@dataclass
+
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Field names per suggestion dataclass, filled on first serialization
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _suggestion_to_dict(suggestion: Any) -> Dict:
+    """
+    Shallow equivalent of dataclasses.asdict() for flat suggestion types.
+    
+    Suggestions hold only scalars and lists of strings, so list fields are
+    copied and the recursive deepcopy walk of asdict() is skipped.
+    """
+    names = _FIELD_NAMES.get(type(suggestion))
+    if names is None:
+        names = _FIELD_NAMES[type(suggestion)] = tuple(f.name for f in fields(suggestion))
+    
+    result = {}
+    for name in names:
+        value = getattr(suggestion, name)
+        result[name] = list(value) if isinstance(value, list) else value
+    return result
+
+
+@dataclass(**_SLOTS)
 class CoachingSession:
     """Represents a coaching interaction"""
     session_id: str
@@ -36,7 +70,7 @@ class CoachingSession:
     suggestions_dismissed: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SuggestionResult:
     """Result of a suggestion request with fade-out applied"""
     suggestion_type: str  # 'naming', 'folder', 'convention', 'none'
@@ -46,16 +80,65 @@ class SuggestionResult:
     skill_level: str  # 'struggling', 'learning', 'proficient', 'mastered'
     should_show: bool  # Whether to actually display to user
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Field dict without the recursive deepcopy walk of asdict().
+
+        Content is a flat dict of scalars and fresh lists, so a shallow copy
+        of it is enough.
+        """
+        return {
+            'suggestion_type': self.suggestion_type,
+            'content': dict(self.content) if self.content is not None else None,
+            'intensity': self.intensity,
+            'reason': self.reason,
+            'skill_level': self.skill_level,
+            'should_show': self.should_show
+        }
+
+
+# Results for suggestions that are not shown. They carry no content, so one
+# shared instance serves every identical call; callers must not mutate them.
+_DISABLED_RESULTS = {
+    skill_name: SuggestionResult(
+        suggestion_type='none',
+        content=None,
+        intensity=0.0,
+        reason=f'User disabled {label} suggestions',
+        skill_level='unknown',
+        should_show=False
+    )
+    for skill_name, label in (('naming_consistency', 'naming'), ('folder_organization', 'folder'))
+}
+_FADED_RESULTS: Dict[Tuple[str, float, str], SuggestionResult] = {}
+
+
+def _faded_result(suggestion_type: str, intensity: float, skill_level: str) -> SuggestionResult:
+    """Shared result for a suggestion faded out at the given intensity and level."""
+    key = (suggestion_type, intensity, skill_level)
+    result = _FADED_RESULTS.get(key)
+    if result is None:
+        result = _FADED_RESULTS[key] = SuggestionResult(
+            suggestion_type=suggestion_type,
+            content=None,
+            intensity=intensity,
+            reason=f'Faded out - skill level: {skill_level}',
+            skill_level=skill_level,
+            should_show=False
+        )
+    return result
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class CoachingState:
     """Persistent state of the coaching system"""
     total_suggestions_offered: int = 0
     total_suggestions_accepted: int = 0
     total_suggestions_dismissed: int = 0
     last_assessment: Optional[str] = None
-    skill_history: Dict[str, List[Dict]] = field(default_factory=dict)
+    skill_history: Dict[str, Deque[Dict]] = field(default_factory=dict)  # Bounded by HISTORY_LIMIT
     fade_out_overrides: Dict[str, bool] = field(default_factory=dict)  # User can force-disable per skill
+    show_positions: Dict[str, float] = field(default_factory=dict)  # Per-skill show/hide schedule position
 
 
 class AdaptiveCoach:
@@ -91,6 +174,12 @@ class AdaptiveCoach:
     SKILL_LEARNING = 0.7
     SKILL_PROFICIENT = 0.85
     
+    # _calculate_intensity lookup tables, indexed by bisecting SKILL_BOUNDS
+    SKILL_BOUNDS = (SKILL_STRUGGLING, SKILL_LEARNING, SKILL_PROFICIENT)
+    SKILL_LEVELS = ('struggling', 'learning', 'proficient', 'mastered')
+    BASE_INTENSITY = (INTENSITY_FULL, INTENSITY_REGULAR, INTENSITY_OCCASIONAL, INTENSITY_MINIMAL)
+    TREND_ADJUSTMENT = {'regressing': 0.2, 'improving': -0.1}
+    
     # How often to show suggestions at each intensity
     SHOW_PROBABILITY = {
         'full': 1.0,       # Every time
@@ -100,6 +189,18 @@ class AdaptiveCoach:
         'none': 0.0,       # Never
     }
     
+    # Seconds a difficulty report is reused before reassessing
+    REPORT_TTL = 300.0
+    
+    # Minimum seconds between writes of coaching_state.json
+    SAVE_INTERVAL = 0.5
+    
+    # Assessments kept per skill in skill_history
+    HISTORY_LIMIT = 100
+    
+    # Golden-ratio step for the show/hide schedule (see _should_show_at_intensity)
+    SHOW_STEP = 0.6180339887
+    
     def __init__(self, data_dir: Optional[str] = None):
         """
         Initialize the adaptive coach.
@@ -111,21 +212,60 @@ class AdaptiveCoach:
         self.data_dir = Path(data_dir) if data_dir else Path.home() / '.wayfinder' / 'learning'
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize components
-        self.tracker = BehaviorTracker(str(self.data_dir))
-        self.detector = DifficultyDetector(self.tracker)
-        self.suggester = SuggestionEngine(self.tracker)
+        # Components are imported and built on first use (see tracker/detector/suggester)
+        self._tracker: Optional['BehaviorTracker'] = None
+        self._detector: Optional['DifficultyDetector'] = None
+        self._suggester: Optional['SuggestionEngine'] = None
         
-        # Load persistent state
+        # Load persistent state; writes are coalesced (see _save_state)
+        self.state_file = self.data_dir / 'coaching_state.json'
+        self.history_file = self.data_dir / 'skill_history.jsonl'
         self.state = self._load_state()
+        self._dirty = False
+        self._last_flush = 0.0
+        atexit.register(self._flush_state)
         
         # Current session
         self.current_session: Optional[CoachingSession] = None
         
         # Cache for skill assessment (avoid re-computing constantly)
-        self._cached_report: Optional[DifficultyReport] = None
-        self._cache_time: Optional[datetime] = None
-        self._cache_duration = timedelta(minutes=5)
+        self._cached_report: Optional['DifficultyReport'] = None
+        self._cache_expiry = 0.0  # time.monotonic() deadline for _cached_report
+        self._intensity_cache: Dict[str, Tuple[float, str]] = {}  # (intensity, level) per skill in _cached_report
+        
+        # get_status/get_fade_status results, reused while their inputs are unchanged
+        self._status_cache: Optional[Dict] = None
+        self._status_cache_key: Optional[Tuple] = None
+        self._fade_cache: Optional[Dict[str, Dict]] = None
+        self._fade_cache_key: Optional[Tuple] = None
+    
+    # =========================================================================
+    # Components
+    # =========================================================================
+    
+    @property
+    def tracker(self) -> 'BehaviorTracker':
+        """Behavior tracker, loaded on first access."""
+        if self._tracker is None:
+            from .behavior_tracker import BehaviorTracker
+            self._tracker = BehaviorTracker(str(self.data_dir))
+        return self._tracker
+    
+    @property
+    def detector(self) -> 'DifficultyDetector':
+        """Difficulty detector, loaded on first access."""
+        if self._detector is None:
+            from .difficulty_detector import DifficultyDetector
+            self._detector = DifficultyDetector(self.tracker)
+        return self._detector
+    
+    @property
+    def suggester(self) -> 'SuggestionEngine':
+        """Suggestion engine, loaded on first access."""
+        if self._suggester is None:
+            from .suggestion_engine import SuggestionEngine
+            self._suggester = SuggestionEngine(self.tracker)
+        return self._suggester
     
     # =========================================================================
     # Session Management
@@ -172,6 +312,7 @@ class AdaptiveCoach:
         
         self.tracker.end_session()
         self.current_session = None
+        self._flush_state()
         
         return summary
     
@@ -196,6 +337,10 @@ class AdaptiveCoach:
         Returns:
             SuggestionResult with should_show indicating whether to display
         """
+        # User override skips the assessment entirely
+        if self.state.fade_out_overrides.get('naming_consistency', False):
+            return _DISABLED_RESULTS['naming_consistency']
+        
         # Get skill level for naming
         report = self._get_difficulty_report()
         naming_skill = report.skills.get('naming_consistency')
@@ -210,31 +355,13 @@ class AdaptiveCoach:
             )
         
         # Calculate intensity based on skill
-        intensity, skill_level = self._calculate_intensity(naming_skill)
-        
-        # Check for user override
-        if self.state.fade_out_overrides.get('naming_consistency', False):
-            return SuggestionResult(
-                suggestion_type='none',
-                content=None,
-                intensity=0.0,
-                reason='User disabled naming suggestions',
-                skill_level=skill_level,
-                should_show=False
-            )
+        intensity, skill_level = self._intensity_cache['naming_consistency']
         
         # Determine if we should show based on intensity
-        should_show = self._should_show_at_intensity(intensity)
+        should_show = self._should_show_at_intensity(intensity, 'naming_consistency')
         
         if not should_show:
-            return SuggestionResult(
-                suggestion_type='naming',
-                content=None,
-                intensity=intensity,
-                reason=f'Faded out - skill level: {skill_level}',
-                skill_level=skill_level,
-                should_show=False
-            )
+            return _faded_result('naming', intensity, skill_level)
         
         return self._create_naming_result(
             filename, content, file_path,
@@ -258,6 +385,10 @@ class AdaptiveCoach:
         Returns:
             SuggestionResult with should_show indicating whether to display
         """
+        # User override skips the assessment entirely
+        if self.state.fade_out_overrides.get('folder_organization', False):
+            return _DISABLED_RESULTS['folder_organization']
+        
         report = self._get_difficulty_report()
         folder_skill = report.skills.get('folder_organization')
         
@@ -269,29 +400,12 @@ class AdaptiveCoach:
                 reason='No folder organization history'
             )
         
-        intensity, skill_level = self._calculate_intensity(folder_skill)
-        
-        if self.state.fade_out_overrides.get('folder_organization', False):
-            return SuggestionResult(
-                suggestion_type='none',
-                content=None,
-                intensity=0.0,
-                reason='User disabled folder suggestions',
-                skill_level=skill_level,
-                should_show=False
-            )
+        intensity, skill_level = self._intensity_cache['folder_organization']
         
-        should_show = self._should_show_at_intensity(intensity)
+        should_show = self._should_show_at_intensity(intensity, 'folder_organization')
         
         if not should_show:
-            return SuggestionResult(
-                suggestion_type='folder',
-                content=None,
-                intensity=intensity,
-                reason=f'Faded out - skill level: {skill_level}',
-                skill_level=skill_level,
-                should_show=False
-            )
+            return _faded_result('folder', intensity, skill_level)
         
         return self._create_folder_result(
             file_path, available_folders,
@@ -317,7 +431,7 @@ class AdaptiveCoach:
         if not search_skill:
             return None  # Let them try first
         
-        intensity, skill_level = self._calculate_intensity(search_skill)
+        intensity, skill_level = self._intensity_cache['search_ability']
         
         # Only show tips for struggling/learning users
         if intensity < self.INTENSITY_OCCASIONAL:
@@ -389,6 +503,7 @@ class AdaptiveCoach:
         
         # Invalidate cache to get fresh assessment
         self._cached_report = None
+        self._invalidate_status_cache()
     
     # =========================================================================
     # Status and Reporting
@@ -402,10 +517,18 @@ class AdaptiveCoach:
             Dict with skill levels, intensities, and recommendations
         """
         report = self._get_difficulty_report()
+        key = self._status_key(
+            self.state.total_suggestions_offered,
+            self.state.total_suggestions_accepted,
+            self.state.total_suggestions_dismissed,
+            self.current_session is not None
+        )
+        if self._status_cache is not None and self._status_cache_key == key:
+            return copy.deepcopy(self._status_cache)
         
         skills_status = {}
         for name, assessment in report.skills.items():
-            intensity, level = self._calculate_intensity(assessment)
+            intensity, level = self._intensity_cache[name]
             skills_status[name] = {
                 'score': assessment.score,
                 'level': level,
@@ -416,7 +539,7 @@ class AdaptiveCoach:
                 'confidence': assessment.confidence
             }
         
-        return {
+        self._status_cache = {
             'overall_skill': report.overall_skill,
             'skills': skills_status,
             'suggestions': {
@@ -429,21 +552,22 @@ class AdaptiveCoach:
                 )
             },
             'recommendations': report.recommendations,
-            'struggles': [s['area'] for s in report.struggles] if report.struggles else [],
-            'improvements': [i['area'] for i in report.improvements] if report.improvements else [],
-            'regressions': [r['area'] for r in report.regressions] if report.regressions else [],
+            'struggles': [s['skill'] for s in report.struggles] if report.struggles else [],
+            'improvements': [i['skill'] for i in report.improvements] if report.improvements else [],
+            'regressions': [r['skill'] for r in report.regressions] if report.regressions else [],
             'session_active': self.current_session is not None
         }
+        self._status_cache_key = key
+        return copy.deepcopy(self._status_cache)
     
     def get_skill_history(self, skill_name: str, days: int = 30) -> List[Dict]:
         """Get historical skill scores for visualization."""
-        history = self.state.skill_history.get(skill_name, [])
-        cutoff = datetime.now() - timedelta(days=days)
+        history = self.state.skill_history.get(skill_name, ())
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
         
-        return [
-            entry for entry in history
-            if datetime.fromisoformat(entry['date']) > cutoff
-        ]
+        # Entries are appended in time order, so the window is a suffix
+        start = bisect.bisect_right([entry['ts'] for entry in history], cutoff)
+        return list(itertools.islice(history, start, None))
     
     def get_fade_status(self) -> Dict[str, Dict]:
         """
@@ -452,10 +576,13 @@ class AdaptiveCoach:
         Returns which skills are still getting suggestions and which have faded.
         """
         report = self._get_difficulty_report()
+        key = self._status_key()
+        if self._fade_cache is not None and self._fade_cache_key == key:
+            return copy.deepcopy(self._fade_cache)
         
         fade_status = {}
         for name, assessment in report.skills.items():
-            intensity, level = self._calculate_intensity(assessment)
+            intensity, level = self._intensity_cache[name]
             
             fade_status[name] = {
                 'level': level,
@@ -465,7 +592,9 @@ class AdaptiveCoach:
                 'will_re_engage': assessment.trend == 'regressing'
             }
         
-        return fade_status
+        self._fade_cache = fade_status
+        self._fade_cache_key = key
+        return copy.deepcopy(fade_status)
     
     # =========================================================================
     # User Controls
@@ -480,6 +609,7 @@ class AdaptiveCoach:
             disabled: True to disable suggestions, False to re-enable
         """
         self.state.fade_out_overrides[skill_name] = disabled
+        self._invalidate_status_cache()
         self._save_state()
     
     def reset_skill_tracking(self, skill_name: Optional[str] = None):
@@ -490,12 +620,14 @@ class AdaptiveCoach:
             skill_name: Specific skill to reset, or None for all
         """
         if skill_name:
-            self.state.skill_history[skill_name] = []
+            self.state.skill_history[skill_name] = deque(maxlen=self.HISTORY_LIMIT)
         else:
             self.state.skill_history = {}
         
+        self._rewrite_skill_history()
         self._save_state()
         self._cached_report = None
+        self._invalidate_status_cache()
     
     def force_re_engagement(self, skill_name: str):
         """
@@ -508,50 +640,55 @@ class AdaptiveCoach:
             del self.state.fade_out_overrides[skill_name]
         
         # Clear history to reset to "learning" state
-        self.state.skill_history[skill_name] = []
+        self.state.skill_history[skill_name] = deque(maxlen=self.HISTORY_LIMIT)
         
+        self._rewrite_skill_history()
         self._save_state()
         self._cached_report = None
+        self._invalidate_status_cache()
+    
+    # =========================================================================
+    # Internal: Status Caching
+    # =========================================================================
+    
+    def _status_key(self, *extra) -> Tuple:
+        """
+        Identify the inputs a status dict was built from.
+        
+        Changes whenever the difficulty report is recomputed or an override
+        changes; extra carries any further values the caller depends on.
+        """
+        return (
+            id(self._cached_report),
+            self._cache_expiry,
+            tuple(sorted(self.state.fade_out_overrides.items())),
+        ) + extra
+    
+    def _invalidate_status_cache(self):
+        """Drop cached get_status/get_fade_status results."""
+        self._status_cache = None
+        self._fade_cache = None
     
     # =========================================================================
     # Internal: Intensity Calculation
     # =========================================================================
     
-    def _calculate_intensity(self, assessment: SkillAssessment) -> Tuple[float, str]:
+    def _calculate_intensity(self, assessment: 'SkillAssessment') -> Tuple[float, str]:
         """
         Calculate suggestion intensity based on skill assessment.
         
         Returns:
             Tuple of (intensity_value, skill_level_name)
         """
-        score = assessment.score
         trend = assessment.trend
+        i = bisect.bisect_right(self.SKILL_BOUNDS, assessment.score)
         
-        # Base intensity on score
-        if score < self.SKILL_STRUGGLING:
-            base_intensity = self.INTENSITY_FULL
-            level = 'struggling'
-        elif score < self.SKILL_LEARNING:
-            base_intensity = self.INTENSITY_REGULAR
-            level = 'learning'
-        elif score < self.SKILL_PROFICIENT:
-            base_intensity = self.INTENSITY_OCCASIONAL
-            level = 'proficient'
-        else:
-            base_intensity = self.INTENSITY_MINIMAL
-            level = 'mastered'
-        
-        # Adjust for trend
-        if trend == 'regressing':
-            # Increase intensity if skill is declining
-            adjusted = min(base_intensity + 0.2, self.INTENSITY_FULL)
-            if level == 'mastered':
-                level = 'proficient'  # Downgrade status
-        elif trend == 'improving':
-            # Decrease intensity faster if improving
-            adjusted = max(base_intensity - 0.1, self.INTENSITY_NONE)
-        else:
-            adjusted = base_intensity
+        # Regressing raises intensity, improving lowers it faster
+        adjusted = self.BASE_INTENSITY[i] + self.TREND_ADJUSTMENT.get(trend, 0.0)
+        adjusted = min(max(adjusted, self.INTENSITY_NONE), self.INTENSITY_FULL)
+        
+        # A declining master is downgraded
+        level = self.SKILL_LEVELS[i - (i == 3 and trend == 'regressing')]
         
         # Low confidence means more help
         if assessment.confidence < 0.5:
@@ -559,14 +696,23 @@ class AdaptiveCoach:
         
         return adjusted, level
     
-    def _should_show_at_intensity(self, intensity: float) -> bool:
+    def _should_show_at_intensity(self, intensity: float, skill_name: str) -> bool:
         """
-        Probabilistically decide whether to show suggestion at given intensity.
+        Decide whether to show a suggestion at the given intensity.
         
+        Each skill steps a counter through [0, 1) by the golden ratio, a
+        low-discrepancy sequence: over any run of calls the fraction shown
+        tracks intensity closely, without the streaks of random sampling.
         This creates natural fade-out effect rather than hard cutoffs.
+        
+        The position is persisted with the coaching state, so the schedule
+        continues across processes (the bridge may run one per command).
         """
-        import random
-        return random.random() < intensity
+        positions = self.state.show_positions
+        position = (positions.get(skill_name, 0.0) + self.SHOW_STEP) % 1.0
+        positions[skill_name] = position
+        self._save_state()
+        return position < intensity
     
     # =========================================================================
     # Internal: Suggestion Creation
@@ -591,7 +737,7 @@ class AdaptiveCoach:
         
         return SuggestionResult(
             suggestion_type='naming',
-            content=asdict(suggestion) if suggestion else None,
+            content=_suggestion_to_dict(suggestion) if suggestion else None,
             intensity=intensity,
             reason=reason,
             skill_level=skill_level,
@@ -616,7 +762,7 @@ class AdaptiveCoach:
         
         return SuggestionResult(
             suggestion_type='folder',
-            content=asdict(suggestion) if suggestion else None,
+            content=_suggestion_to_dict(suggestion) if suggestion else None,
             intensity=intensity,
             reason=reason,
             skill_level=skill_level,
@@ -627,30 +773,35 @@ class AdaptiveCoach:
     # Internal: Difficulty Report Caching
     # =========================================================================
     
-    def _get_difficulty_report(self) -> DifficultyReport:
+    def _get_difficulty_report(self) -> 'DifficultyReport':
         """Get difficulty report with caching."""
-        now = datetime.now()
-        
-        if (self._cached_report and self._cache_time and 
-            now - self._cache_time < self._cache_duration):
+        if self._cached_report is not None and time.monotonic() < self._cache_expiry:
             return self._cached_report
         
         self._cached_report = self.detector.assess_all_skills()
-        self._cache_time = now
+        self._intensity_cache = {
+            name: self._calculate_intensity(assessment)
+            for name, assessment in self._cached_report.skills.items()
+        }
+        self._cache_expiry = time.monotonic() + self.REPORT_TTL
+        now = datetime.now()
         
         # Update skill history
+        new_entries = []
         for name, assessment in self._cached_report.skills.items():
             if name not in self.state.skill_history:
-                self.state.skill_history[name] = []
+                self.state.skill_history[name] = deque(maxlen=self.HISTORY_LIMIT)
             
-            self.state.skill_history[name].append({
+            entry = {
                 'date': now.isoformat(),
+                'ts': now.timestamp(),
                 'score': assessment.score,
                 'trend': assessment.trend
-            })
-            
-            # Keep only last 100 entries
-            self.state.skill_history[name] = self.state.skill_history[name][-100:]
+            }
+            self.state.skill_history[name].append(entry)  # Oldest entry drops off
+            new_entries.append((name, entry))
+        
+        self._append_skill_history(new_entries)
         
         self.state.last_assessment = now.isoformat()
         self._save_state()
@@ -663,38 +814,131 @@ class AdaptiveCoach:
     
     def _load_state(self) -> CoachingState:
         """Load persistent state from disk."""
-        state_file = self.data_dir / 'coaching_state.json'
+        state = CoachingState()
         
-        if state_file.exists():
+        if self.state_file.exists():
             try:
-                with open(state_file, 'r') as f:
-                    data = json.load(f)
-                    return CoachingState(
+                with open(self.state_file, 'rb') as f:
+                    data = jsonio.loads(f.read())
+                    state = CoachingState(
                         total_suggestions_offered=data.get('total_suggestions_offered', 0),
                         total_suggestions_accepted=data.get('total_suggestions_accepted', 0),
                         total_suggestions_dismissed=data.get('total_suggestions_dismissed', 0),
                         last_assessment=data.get('last_assessment'),
-                        skill_history=data.get('skill_history', {}),
-                        fade_out_overrides=data.get('fade_out_overrides', {})
+                        skill_history={
+                            name: deque(entries, maxlen=self.HISTORY_LIMIT)
+                            for name, entries in data.get('skill_history', {}).items()
+                        },
+                        fade_out_overrides=data.get('fade_out_overrides', {}),
+                        show_positions=data.get('show_positions', {})
                     )
-            except (json.JSONDecodeError, KeyError):
+            except (ValueError, KeyError):
                 pass
         
-        return CoachingState()
+        if self.history_file.exists():
+            state.skill_history, line_count = self._load_skill_history()
+            retained = sum(len(h) for h in state.skill_history.values())
+            if self._add_timestamps(state.skill_history) or line_count > 2 * retained:
+                self._rewrite_skill_history(state.skill_history)  # Compact the log
+        elif state.skill_history:
+            # Older versions kept history inside coaching_state.json
+            self._add_timestamps(state.skill_history)
+            self._rewrite_skill_history(state.skill_history)
+        
+        return state
+    
+    def _load_skill_history(self) -> Tuple[Dict[str, Deque[Dict]], int]:
+        """
+        Read the append-only history log, keeping the last HISTORY_LIMIT
+        entries per skill.
+        
+        Returns:
+            Tuple of (history by skill, number of lines in the log)
+        """
+        history: Dict[str, Deque[Dict]] = {}
+        line_count = 0
+        
+        with open(self.history_file, 'rb') as f:
+            for line in f:
+                line_count += 1
+                try:
+                    entry = jsonio.loads(line)
+                    name = entry.pop('skill')
+                except (ValueError, KeyError):
+                    continue  # Torn final line from an interrupted append
+                if name not in history:
+                    history[name] = deque(maxlen=self.HISTORY_LIMIT)
+                history[name].append(entry)
+        
+        return history, line_count
+    
+    def _add_timestamps(self, skill_history: Dict[str, Deque[Dict]]) -> bool:
+        """
+        Fill in the epoch 'ts' of entries written before it was recorded.
+        
+        Returns:
+            True if any entry was changed
+        """
+        changed = False
+        for entries in skill_history.values():
+            for entry in entries:
+                if 'ts' not in entry:
+                    entry['ts'] = datetime.fromisoformat(entry['date']).timestamp()
+                    changed = True
+        return changed
+    
+    def _append_skill_history(self, entries: List[Tuple[str, Dict]]):
+        """Append (skill_name, entry) pairs to the history log."""
+        with open(self.history_file, 'ab') as f:
+            f.writelines(
+                jsonio.dumps({'skill': name, **entry}) + b'\n' for name, entry in entries
+            )
+    
+    def _rewrite_skill_history(self, skill_history: Optional[Dict[str, Deque[Dict]]] = None):
+        """Replace the history log with the given (default: current) history."""
+        if skill_history is None:
+            skill_history = self.state.skill_history
+        
+        tmp_file = self.history_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            for name, entries in skill_history.items():
+                f.writelines(jsonio.dumps({'skill': name, **entry}) + b'\n' for entry in entries)
+        os.replace(tmp_file, self.history_file)
     
     def _save_state(self):
-        """Save persistent state to disk."""
-        state_file = self.data_dir / 'coaching_state.json'
+        """
+        Mark state as changed and persist it, at most once per SAVE_INTERVAL.
         
-        with open(state_file, 'w') as f:
-            json.dump({
+        Bursts of updates (responses, assessments) cost a flag set instead of
+        a full rewrite each; anything still pending is written by the next
+        save after the interval, by end_session, or at interpreter exit.
+        """
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self.SAVE_INTERVAL:
+            self._flush_state()
+    
+    def _flush_state(self):
+        """Write state to disk if it changed since the last flush."""
+        if not self._dirty:
+            return
+        
+        tmp_file = self.state_file.with_suffix('.tmp')
+        
+        # Write to a temp file and swap it in so a crash never leaves half a file.
+        # skill_history lives in its own append-only log (skill_history.jsonl).
+        with open(tmp_file, 'wb') as f:
+            f.write(jsonio.dumps({
                 'total_suggestions_offered': self.state.total_suggestions_offered,
                 'total_suggestions_accepted': self.state.total_suggestions_accepted,
                 'total_suggestions_dismissed': self.state.total_suggestions_dismissed,
                 'last_assessment': self.state.last_assessment,
-                'skill_history': self.state.skill_history,
-                'fade_out_overrides': self.state.fade_out_overrides
-            }, f, indent=2)
+                'fade_out_overrides': self.state.fade_out_overrides,
+                'show_positions': self.state.show_positions
+            }))
+        os.replace(tmp_file, self.state_file)
+        
+        self._dirty = False
+        self._last_flush = time.monotonic()
     
     # =========================================================================
     # Internal: Utilities
@@ -734,9 +978,9 @@ def create_coach_api() -> Dict[str, callable]:
         'coach_start_session': lambda: coach.start_session(),
         'coach_end_session': lambda: coach.end_session(),
         'coach_get_naming_suggestion': lambda filename, content=None: 
-            asdict(coach.get_naming_suggestion(filename, content)),
+            coach.get_naming_suggestion(filename, content).to_dict(),
         'coach_get_folder_suggestion': lambda file_path, folders=None:
-            asdict(coach.get_folder_suggestion(file_path, folders)),
+            coach.get_folder_suggestion(file_path, folders).to_dict(),
         'coach_get_search_tip': coach.get_search_tip,
         'coach_record_response': coach.record_suggestion_response,
         'coach_get_status': coach.get_status,
@@ -11,20 +11,69 @@ Tracks:
 Privacy: All data is local, never transmitted. User can delete anytime.
 """
 
-import json
+import atexit
 import os
+import re
+import sqlite3
+import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict, field
-from collections import defaultdict
-import hashlib
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
+from dataclasses import dataclass, asdict, field, fields
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import chain
+from secrets import token_hex
+
+import numpy as np
+
+from .. import jsonio
+
+
+@lru_cache(maxsize=None)
+def _naming_kernels():
+    """
+    The naming_kernels module, imported (and compiled) on first use, or None
+    without numba. Importing numba costs about half a second, which only
+    large rename histories repay.
+    """
+    try:
+        from . import naming_kernels
+    except ImportError:
+        return None
+    return naming_kernels
+
+
+def _iso(timestamp: Any) -> str:
+    """Format an epoch timestamp as ISO 8601 (strings pass through)"""
+    if isinstance(timestamp, str):
+        return timestamp
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+# Name traits for naming preferences. Dates: four or more ASCII digits anywhere
+# (YYYY, YYYYMM, YYYYMMDD). Prefix: text before the first separator, trying
+# '_', then '-', then ' ' -- the alternation order sets the precedence.
+_DATE_RE = re.compile(r'(?:\d\D*){4}', re.ASCII)
+_PREFIX_RE = re.compile(r'([^_]*)_|([^-]*)-|([^ ]*) ')
+
+
+@lru_cache(maxsize=4096)
+def _file_extension(file_path: str) -> str:
+    """Lowercased suffix of a path, as Path(file_path).suffix.lower() gives it"""
+    file_path = file_path.rstrip('/\\')
+    sep = max(file_path.rfind('/'), file_path.rfind('\\'))
+    dot = file_path.rfind('.')
+    if dot <= sep + 1 or dot == len(file_path) - 1:
+        return ''  # No dot in the name, a leading-dot name, or a trailing dot
+    return sys.intern(file_path[dot:].lower())
 
 
 @dataclass
 class SearchEvent:
     """Record of a single search attempt"""
-    timestamp: str
+    timestamp: float  # Epoch seconds
     query: str
     results_count: int
     clicked_result: Optional[str]  # Which result they clicked (None = abandoned)
@@ -36,7 +85,7 @@ class SearchEvent:
 @dataclass
 class FileAccessEvent:
     """Record of file being opened/accessed"""
-    timestamp: str
+    timestamp: float  # Epoch seconds
     file_path: str
     file_type: str
     access_type: str  # 'open', 'preview', 'edit', 'rename', 'move', 'delete'
@@ -50,7 +99,7 @@ class FileAccessEvent:
 @dataclass 
 class NavigationEvent:
     """Record of folder navigation and browsing"""
-    timestamp: str
+    timestamp: float  # Epoch seconds
     path: str
     time_spent_seconds: float
     files_viewed: int
@@ -61,7 +110,7 @@ class NavigationEvent:
 @dataclass
 class OrganizationDecision:
     """Record of user's organizational choices"""
-    timestamp: str
+    timestamp: float  # Epoch seconds
     decision_type: str  # 'approve_suggestion', 'reject_suggestion', 'custom_name', 'folder_choice'
     suggested_value: Optional[str]
     user_value: str
@@ -69,43 +118,153 @@ class OrganizationDecision:
     context: Dict[str, Any]  # Additional info about the decision
 
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class UserSession:
-    """A session of user activity"""
+    """
+    A session of user activity.
+    
+    Events are stored column-wise: each kind maps its event fields (less the
+    session_id) to parallel lists, one entry per event.
+    """
     session_id: str
     start_time: str
     end_time: Optional[str] = None
-    searches: List[SearchEvent] = field(default_factory=list)
-    file_accesses: List[FileAccessEvent] = field(default_factory=list)
-    navigation: List[NavigationEvent] = field(default_factory=list)
-    decisions: List[OrganizationDecision] = field(default_factory=list)
+    searches: Dict[str, List] = field(default_factory=lambda: _columns(SearchEvent))
+    file_accesses: Dict[str, List] = field(default_factory=lambda: _columns(FileAccessEvent))
+    navigation: Dict[str, List] = field(default_factory=lambda: _columns(NavigationEvent))
+    decisions: Dict[str, List] = field(default_factory=lambda: _columns(OrganizationDecision))
+
+
+def _columns(event_type: type) -> Dict[str, List]:
+    """Empty per-field columns for an event dataclass"""
+    return {f.name: [] for f in fields(event_type) if f.name != 'session_id'}
+
+
+def _append_row(columns: Dict[str, List], row: Dict):
+    """Append one event (as a dict) across its session columns"""
+    for name, column in columns.items():
+        column.append(row[name])
 
 
 class BehaviorTracker:
     """
     Main behavior tracking engine.
-    Stores all events locally in JSON for analysis.
+    Stores all events locally for analysis.
+    
+    Searches and file accesses are stored in SQLite (behavior.db), indexed by
+    timestamp so windowed analytics read only the rows they need; the other
+    events are appended to an NDJSON log, one line per event. Writes are
+    buffered: new rows and lines are written every FLUSH_EVENTS events or
+    FLUSH_INTERVAL seconds; changed session/stats files only at session end,
+    on flush(), and at interpreter exit.
+    """
+    
+    # Event category in self.events -> 'kind' tag of its lines in the log
+    EVENT_KINDS = {
+        'searches': 'search',
+        'file_accesses': 'file_access',
+        'navigation': 'navigation',
+        'decisions': 'decision',
+    }
+    
+    # Event categories kept in SQLite, and their columns (the event fields)
+    TABLE_COLUMNS = {
+        'searches': tuple(f.name for f in fields(SearchEvent)),
+        'file_accesses': tuple(f.name for f in fields(FileAccessEvent)),
+    }
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS searches (
+            timestamp REAL, query TEXT, results_count INTEGER, clicked_result TEXT,
+            time_to_click_ms INTEGER, refined_query TEXT, session_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS searches_timestamp ON searches (timestamp);
+        CREATE TABLE IF NOT EXISTS file_accesses (
+            timestamp REAL, file_path TEXT, file_type TEXT, access_type TEXT,
+            previous_name TEXT, new_name TEXT, source_path TEXT, dest_path TEXT,
+            session_id TEXT
+        );
+        CREATE INDEX IF NOT EXISTS file_accesses_timestamp ON file_accesses (timestamp);
+        CREATE TABLE IF NOT EXISTS imported_sources (source TEXT PRIMARY KEY);
     """
     
+    # Events recorded before buffered events are written
+    FLUSH_EVENTS = 50
+    
+    # Maximum seconds buffered events wait for the next event-triggered write
+    FLUSH_INTERVAL = 5.0
+    
+    # Encoded events held before they are written to the log in one call
+    EVENT_BUFFER_BYTES = 1 << 16
+    
+    # Most recent events of each category kept in memory; all stay on disk
+    EVENT_HISTORY = 10_000
+    
+    # Rename count above which names are analyzed with the Numba kernel
+    NUMBA_MIN_NAMES = 5000
+    
     def __init__(self, data_dir: str = None):
         self.data_dir = Path(data_dir or os.path.expanduser("~/.wayfinder/learning"))
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        self.events_file = self.data_dir / "behavior_events.json"
+        self.db_file = self.data_dir / "behavior.db"
+        self.events_file = self.data_dir / "behavior_events.ndjson"
+        self.legacy_events_file = self.data_dir / "behavior_events.json"
         self.sessions_file = self.data_dir / "sessions.json"
         self.stats_file = self.data_dir / "user_stats.json"
         
         self.current_session: Optional[UserSession] = None
+        self._db = self._open_db()
+        self._pending_rows = {category: [] for category in self.TABLE_COLUMNS}
         self._load_data()
+        self.version = 0  # Bumped whenever recorded data changes
+        self._events_fd = self._open_events_log()
+        self._event_buffer = bytearray()
+        
+        # Analytics results: (method, args) -> (data version, result). Results are
+        # shared between callers and must not be mutated.
+        self._analytics_cache: Dict[Tuple, Tuple[Tuple, Dict]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Files with unwritten changes, and events recorded since the last write
+        self._dirty = {'sessions': False, 'stats': False}
+        self._pending_writes = 0
+        self._last_flush = time.monotonic()
+        atexit.register(self._save_data)
     
     def _load_data(self):
         """Load existing tracking data"""
-        self.events = self._load_json(self.events_file, default={
-            'searches': [],
-            'file_accesses': [],
-            'navigation': [],
-            'decisions': []
-        })
+        if not self.events_file.exists() and self.legacy_events_file.exists():
+            # Older versions rewrote all events to one JSON document
+            legacy = self._load_json(self.legacy_events_file, default={})
+            self._import_events(
+                (
+                    (category, event)
+                    for category, events in legacy.items() if category in self.EVENT_KINDS
+                    for event in events
+                ),
+                self.legacy_events_file
+            )
+            # Kept under another name as a backup of the imported history
+            os.replace(
+                self.legacy_events_file,
+                self.legacy_events_file.with_name(self.legacy_events_file.name + '.migrated')
+            )
+        
+        self.events, repair = self._load_events()
+        if repair:
+            self._import_events(self._read_events(), self.events_file)
+            self.events, _ = self._load_events()
+        for category in self.TABLE_COLUMNS:
+            self.events[category] = deque(
+                self._recent_rows(category, self.EVENT_HISTORY), maxlen=self.EVENT_HISTORY
+            )
+        
         self.sessions = self._load_json(self.sessions_file, default=[])
         self.stats = self._load_json(self.stats_file, default={
             'total_searches': 0,
@@ -119,31 +278,269 @@ class BehaviorTracker:
             'last_seen': None,
             'skill_scores': {}
         })
+        
+        # Rebuild the naming totals if missing or out of step with stored renames
+        names = self._rename_names()
+        agg = self.stats.get('naming_agg')
+        if not agg or agg.get('count') != len(names):
+            agg = self.stats['naming_agg'] = self._empty_naming_agg()
+            self._tally_names(agg, names)
     
     def _load_json(self, path: Path, default: Any) -> Any:
         """Load JSON file or return default"""
         if path.exists():
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return jsonio.loads(path.read_bytes())
             except:
                 return default
         return default
     
+    def _read_events(self) -> Iterator[Optional[Tuple[str, Dict]]]:
+        """
+        Stream (category, event) pairs from the event log, oldest first.
+        
+        Yields None for each unreadable line.
+        """
+        if not self.events_file.exists():
+            return
+        categories = {kind: category for category, kind in self.EVENT_KINDS.items()}
+        
+        with open(self.events_file, 'rb') as f:
+            for line in f:
+                try:
+                    event = jsonio.loads(line)
+                    category = categories[event.pop('kind')]
+                except (ValueError, KeyError, AttributeError):
+                    yield None  # Partial line from an interrupted write
+                    continue
+                yield category, event
+    
+    def _load_events(self) -> Tuple[Dict[str, deque], bool]:
+        """
+        Load the most recent EVENT_HISTORY logged events of each category.
+        
+        Returns:
+            Tuple of (events by category, whether the log needs repair:
+            it has unreadable lines or events written by older versions)
+        """
+        events = {category: deque(maxlen=self.EVENT_HISTORY) for category in self.EVENT_KINDS}
+        repair = False
+        
+        for item in self._read_events():
+            if item is None:
+                repair = True
+                continue
+            category, event = item
+            timestamp = event.get('timestamp')
+            if timestamp is None:
+                repair = True  # Dropped by the repair; analytics need a time
+                continue
+            if category in self.TABLE_COLUMNS or isinstance(timestamp, str):
+                repair = True
+            events[category].append(event)
+        
+        return events, repair
+    
+    def _import_events(self, events: Iterable[Optional[Tuple[str, Dict]]], source: Path):
+        """
+        Replace the event log with the given (category, event) pairs.
+        
+        Events of categories kept in SQLite are inserted there instead, ISO
+        timestamps written by older versions are converted to epoch seconds,
+        and None entries (unreadable lines) and events without a readable
+        timestamp are dropped.
+        
+        The rows are committed together with a marker naming the source
+        file's current state, before the log is replaced. If the process dies
+        in between, the next import of the unchanged source finds the marker
+        and only rewrites the log instead of inserting the rows again.
+        """
+        stat = source.stat()
+        marker = f"{source.name}:{stat.st_size}:{stat.st_mtime_ns}"
+        imported = self._db.execute(
+            'SELECT 1 FROM imported_sources WHERE source = ?', (marker,)
+        ).fetchone() is not None
+        
+        rows = {category: [] for category in self.TABLE_COLUMNS}
+        tmp_file = self.events_file.with_suffix('.tmp')
+        
+        with open(tmp_file, 'wb') as f:
+            for item in events:
+                if item is None:
+                    continue
+                category, event = item
+                timestamp = event.get('timestamp')
+                if isinstance(timestamp, str):
+                    try:
+                        timestamp = datetime.fromisoformat(timestamp).timestamp()
+                    except ValueError:
+                        timestamp = None
+                    event['timestamp'] = timestamp
+                if timestamp is None:
+                    continue  # Legacy or hand-edited event without a usable time
+                if category in rows:
+                    rows[category].append(
+                        tuple(event.get(column) for column in self.TABLE_COLUMNS[category])
+                    )
+                else:
+                    f.write(jsonio.dumps({'kind': self.EVENT_KINDS[category], **event}, default=str))
+                    f.write(b'\n')
+        
+        if not imported and any(rows.values()):
+            self._db.execute('BEGIN')
+            for category, category_rows in rows.items():
+                self._execute_insert(category, category_rows)
+            self._db.execute('INSERT INTO imported_sources (source) VALUES (?)', (marker,))
+            self._db.execute('COMMIT')
+        os.replace(tmp_file, self.events_file)
+    
+    def _open_db(self) -> sqlite3.Connection:
+        """Open the event database, creating its tables if needed"""
+        db = sqlite3.connect(str(self.db_file), isolation_level=None)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.executescript(self.SCHEMA)
+        return db
+    
+    def _insert_rows(self, category: str, rows: List[Tuple]):
+        """Insert event rows into a category's table in one transaction"""
+        self._db.execute('BEGIN')
+        self._execute_insert(category, rows)
+        self._db.execute('COMMIT')
+    
+    def _execute_insert(self, category: str, rows: List[Tuple]):
+        """Insert event rows into a category's table in the open transaction"""
+        columns = self.TABLE_COLUMNS[category]
+        self._db.executemany(
+            f"INSERT INTO {category} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            rows
+        )
+    
+    def _select_rows(self, category: str, where: str = '', params: Tuple = ()) -> List[Dict]:
+        """Read events of a category from SQLite, oldest first"""
+        columns = self.TABLE_COLUMNS[category]
+        cursor = self._db.execute(
+            f"SELECT {', '.join(columns)} FROM {category} {where} ORDER BY rowid", params
+        )
+        return [dict(zip(columns, row)) for row in cursor]
+    
+    def _recent_rows(self, category: str, limit: int) -> List[Dict]:
+        """Read the last `limit` events of a category from SQLite, oldest first"""
+        columns = self.TABLE_COLUMNS[category]
+        cursor = self._db.execute(
+            f"SELECT {', '.join(columns)} FROM {category} ORDER BY rowid DESC LIMIT ?", (limit,)
+        )
+        rows = [dict(zip(columns, row)) for row in cursor]
+        rows.reverse()
+        return rows
+    
+    def _window(self, category: str, days: int) -> Tuple[float, int]:
+        """
+        Cutoff time of the last N days, and how many stored events of a
+        category are older than it.
+        """
+        self._write_events()  # Make buffered rows visible to queries
+        cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+        older = self._db.execute(
+            f"SELECT COUNT(*) FROM {category} WHERE timestamp <= ?", (cutoff,)
+        ).fetchone()[0]
+        return cutoff, older
+    
+    def _cache_lookup(self, key: Tuple, version: Tuple) -> Optional[Dict]:
+        """Return a cached analytics result if it was computed from the same data"""
+        entry = self._analytics_cache.get(key)
+        if entry is not None and entry[0] == version:
+            self.cache_hits += 1
+            return entry[1]
+        self.cache_misses += 1
+        return None
+    
+    def _cache_store(self, key: Tuple, version: Tuple, result: Dict) -> Dict:
+        """Cache an analytics result, replacing any stale one for the same key"""
+        self._analytics_cache[key] = (version, result)
+        return result
+    
+    def _append_event(self, category: str, event: Dict):
+        """Add an event to memory and to its (buffered) table or log"""
+        self.events[category].append(event)
+        self.version += 1
+        
+        if category in self.TABLE_COLUMNS:
+            self._pending_rows[category].append(
+                tuple(event[column] for column in self.TABLE_COLUMNS[category])
+            )
+            return
+        
+        self._event_buffer += jsonio.dumps({'kind': self.EVENT_KINDS[category], **event}, default=str)
+        self._event_buffer += b'\n'
+        if len(self._event_buffer) >= self.EVENT_BUFFER_BYTES:
+            self._write_events()
+    
+    def _open_events_log(self) -> int:
+        """Open the event log for appending and return its descriptor"""
+        return os.open(
+            self.events_file,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        )
+    
+    def _write_events(self):
+        """Write all buffered event rows and lines to the database and log"""
+        for category, rows in self._pending_rows.items():
+            if rows:
+                self._insert_rows(category, rows)
+                rows.clear()
+        
+        view = memoryview(self._event_buffer)
+        while view:
+            view = view[os.write(self._events_fd, view):]
+        view.release()
+        self._event_buffer.clear()
+    
+    def compact(self):
+        """Rewrite the NDJSON event log without unreadable lines"""
+        self._write_events()
+        os.close(self._events_fd)
+        self._import_events(self._read_events(), self.events_file)
+        self._events_fd = self._open_events_log()
+    
     def _save_data(self):
-        """Persist all tracking data"""
-        with open(self.events_file, 'w', encoding='utf-8') as f:
-            json.dump(self.events, f, indent=2, default=str)
-        with open(self.sessions_file, 'w', encoding='utf-8') as f:
-            json.dump(self.sessions, f, indent=2, default=str)
-        with open(self.stats_file, 'w', encoding='utf-8') as f:
-            json.dump(self.stats, f, indent=2, default=str)
+        """Persist tracking data, writing only files that changed"""
+        self._write_events()
+        
+        files = (
+            ('sessions', self.sessions_file, self.sessions),
+            ('stats', self.stats_file, self.stats),
+        )
+        for name, path, data in files:
+            if self._dirty[name]:
+                with open(path, 'wb') as f:
+                    f.write(jsonio.dumps(data, default=str))
+                self._dirty[name] = False
+        
+        self._pending_writes = 0
+        self._last_flush = time.monotonic()
+    
+    def _mark_dirty(self, *names: str):
+        """Record an event's changes and write buffered events if due"""
+        for name in names:
+            self._dirty[name] = True
+        self._pending_writes += 1
+        
+        # Sessions and stats are only read on demand and are saved by flush()
+        if (self._pending_writes >= self.FLUSH_EVENTS or
+                time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+            self._write_events()
+            self._pending_writes = 0
+            self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Write any buffered changes to disk now"""
+        self._save_data()
     
     def _generate_session_id(self) -> str:
         """Generate unique session ID"""
-        return hashlib.md5(
-            f"{datetime.now().isoformat()}-{os.getpid()}".encode()
-        ).hexdigest()[:12]
+        return token_hex(6)
     
     # === Session Management ===
     
@@ -160,6 +557,7 @@ class BehaviorTracker:
         if not self.stats['first_seen']:
             self.stats['first_seen'] = now
         self.stats['last_seen'] = now
+        self._dirty['stats'] = True
         
         return session_id
     
@@ -169,6 +567,7 @@ class BehaviorTracker:
             self.current_session.end_time = datetime.now().isoformat()
             self.sessions.append(asdict(self.current_session))
             self.current_session = None
+            self._dirty['sessions'] = True
             self._save_data()
     
     # === Event Recording ===
@@ -182,28 +581,33 @@ class BehaviorTracker:
         refined_query: Optional[str] = None
     ):
         """Record a search event"""
-        if not self.current_session:
+        session = self.current_session
+        if session is None:
             self.start_session()
+            session = self.current_session
+        stats = self.stats
         
+        now = time.time()
         event = SearchEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now,
             query=query,
             results_count=results_count,
             clicked_result=clicked_result,
             time_to_click_ms=time_to_click_ms,
             refined_query=refined_query,
-            session_id=self.current_session.session_id
+            session_id=session.session_id
         )
         
-        self.current_session.searches.append(event)
-        self.events['searches'].append(asdict(event))
+        row = vars(event)
+        _append_row(session.searches, row)
+        self._append_event('searches', row)
         
         # Update stats
-        self.stats['total_searches'] += 1
+        stats['total_searches'] += 1
         if clicked_result:
-            self.stats['successful_searches'] += 1
+            stats['successful_searches'] += 1
         
-        self._save_data()
+        self._mark_dirty('stats')
     
     def record_file_access(
         self,
@@ -215,13 +619,17 @@ class BehaviorTracker:
         dest_path: Optional[str] = None
     ):
         """Record file access event"""
-        if not self.current_session:
+        session = self.current_session
+        if session is None:
             self.start_session()
+            session = self.current_session
+        stats = self.stats
         
-        file_type = Path(file_path).suffix.lower() if file_path else 'unknown'
+        file_type = _file_extension(file_path) if file_path else 'unknown'
         
+        now = time.time()
         event = FileAccessEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now,
             file_path=file_path,
             file_type=file_type,
             access_type=access_type,
@@ -229,18 +637,21 @@ class BehaviorTracker:
             new_name=new_name,
             source_path=source_path,
             dest_path=dest_path,
-            session_id=self.current_session.session_id
+            session_id=session.session_id
         )
         
-        self.current_session.file_accesses.append(event)
-        self.events['file_accesses'].append(asdict(event))
+        row = vars(event)
+        _append_row(session.file_accesses, row)
+        self._append_event('file_accesses', row)
         
         # Update stats
-        self.stats['total_files_accessed'] += 1
+        stats['total_files_accessed'] += 1
         if access_type == 'rename':
-            self.stats['renames_performed'] += 1
+            stats['renames_performed'] += 1
+            if new_name:
+                self._tally_names(stats['naming_agg'], [new_name])
         
-        self._save_data()
+        self._mark_dirty('stats')
     
     def record_navigation(
         self,
@@ -250,21 +661,25 @@ class BehaviorTracker:
         action_taken: str
     ):
         """Record folder navigation"""
-        if not self.current_session:
+        session = self.current_session
+        if session is None:
             self.start_session()
+            session = self.current_session
         
+        now = time.time()
         event = NavigationEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now,
             path=path,
             time_spent_seconds=time_spent_seconds,
             files_viewed=files_viewed,
             action_taken=action_taken,
-            session_id=self.current_session.session_id
+            session_id=session.session_id
         )
         
-        self.current_session.navigation.append(event)
-        self.events['navigation'].append(asdict(event))
-        self._save_data()
+        # Navigation feeds no stats, so it only goes to the log buffer
+        row = vars(event)
+        _append_row(session.navigation, row)
+        self._append_event('navigation', row)
     
     def record_decision(
         self,
@@ -275,51 +690,57 @@ class BehaviorTracker:
         context: Optional[Dict] = None
     ):
         """Record organizational decision"""
-        if not self.current_session:
+        session = self.current_session
+        if session is None:
             self.start_session()
+            session = self.current_session
+        stats = self.stats
         
+        now = time.time()
         decision = OrganizationDecision(
-            timestamp=datetime.now().isoformat(),
+            timestamp=now,
             decision_type=decision_type,
             suggested_value=suggested_value,
             user_value=user_value,
             file_path=file_path,
-            context=context or {}
+            context=dict(context) if context else {}  # Own copy; stored as-is below
         )
         
-        self.current_session.decisions.append(decision)
-        self.events['decisions'].append(asdict(decision))
+        row = vars(decision)
+        _append_row(session.decisions, row)
+        self._append_event('decisions', row)
         
         # Update suggestion stats
         if decision_type == 'approve_suggestion':
-            self.stats['suggestions_accepted'] += 1
+            stats['suggestions_accepted'] += 1
         elif decision_type == 'reject_suggestion':
-            self.stats['suggestions_rejected'] += 1
+            stats['suggestions_rejected'] += 1
         elif decision_type == 'custom_name':
-            self.stats['suggestions_customized'] += 1
+            stats['suggestions_customized'] += 1
         
-        self._save_data()
+        self._mark_dirty('stats')
     
     # === Analytics ===
     
     def get_search_patterns(self, days: int = 30) -> Dict:
         """Analyze search patterns for the last N days"""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_searches = [
-            s for s in self.events['searches']
-            if datetime.fromisoformat(s['timestamp']) > cutoff
-        ]
+        cutoff, older = self._window('searches', days)
+        key = ('search_patterns', days)
+        version = (self.stats['total_searches'], older)
+        cached = self._cache_lookup(key, version)
+        if cached is not None:
+            return cached
+        
+        recent_searches = self._select_rows('searches', 'WHERE timestamp > ?', (cutoff,))
         
         # Find common query patterns
-        query_words = defaultdict(int)
+        query_words = Counter(chain.from_iterable(
+            search['query'].lower().split() for search in recent_searches
+        ))
         failed_queries = []
         refined_searches = []
         
         for search in recent_searches:
-            # Count word frequencies
-            for word in search['query'].lower().split():
-                query_words[word] += 1
-            
             # Track failures (no click)
             if not search.get('clicked_result'):
                 failed_queries.append(search['query'])
@@ -331,31 +752,31 @@ class BehaviorTracker:
                     'refined': search['refined_query']
                 })
         
-        return {
+        return self._cache_store(key, version, {
             'total_searches': len(recent_searches),
-            'common_terms': dict(sorted(query_words.items(), key=lambda x: -x[1])[:20]),
+            'common_terms': dict(query_words.most_common(20)),
             'failed_queries': failed_queries[-10:],  # Last 10 failures
             'search_refinements': refined_searches[-10:],
             'success_rate': self._calculate_success_rate(recent_searches)
-        }
+        })
     
     def get_file_patterns(self, days: int = 30) -> Dict:
         """Analyze file access patterns"""
-        cutoff = datetime.now() - timedelta(days=days)
-        recent_accesses = [
-            a for a in self.events['file_accesses']
-            if datetime.fromisoformat(a['timestamp']) > cutoff
-        ]
+        cutoff, older = self._window('file_accesses', days)
+        key = ('file_patterns', days)
+        version = (self.stats['total_files_accessed'], older)
+        cached = self._cache_lookup(key, version)
+        if cached is not None:
+            return cached
+        
+        recent_accesses = self._select_rows('file_accesses', 'WHERE timestamp > ?', (cutoff,))
         
         # Count by type
-        type_counts = defaultdict(int)
-        access_counts = defaultdict(int)
+        type_counts = Counter(access['file_type'] for access in recent_accesses)
+        access_counts = Counter(access['access_type'] for access in recent_accesses)
         renames = []
         
         for access in recent_accesses:
-            type_counts[access['file_type']] += 1
-            access_counts[access['access_type']] += 1
-            
             if access['access_type'] == 'rename':
                 renames.append({
                     'from': access['previous_name'],
@@ -363,81 +784,125 @@ class BehaviorTracker:
                     'file': access['file_path']
                 })
         
-        return {
+        return self._cache_store(key, version, {
             'total_accesses': len(recent_accesses),
             'by_file_type': dict(type_counts),
             'by_access_type': dict(access_counts),
             'recent_renames': renames[-10:]
-        }
+        })
     
     def get_naming_preferences(self) -> Dict:
         """Learn user's preferred naming patterns from their renames"""
-        renames = [
-            a for a in self.events['file_accesses']
-            if a['access_type'] == 'rename' and a.get('new_name')
-        ]
+        key = ('naming_preferences',)
+        version = (self.stats['naming_agg']['count'],)
+        cached = self._cache_lookup(key, version)
+        if cached is not None:
+            return cached
+        
+        # Totals are maintained as renames are recorded (see _tally_names)
+        agg = self.stats['naming_agg']
+        total = agg['count']
+        if not total:
+            return self._cache_store(key, version, {'learned_patterns': None, 'sample_size': 0})
         
-        # Analyze naming patterns
         patterns = {
-            'uses_dates': 0,
-            'uses_underscores': 0,
-            'uses_hyphens': 0,
-            'uses_camelCase': 0,
-            'uses_lowercase': 0,
-            'uses_prefixes': [],
-            'average_length': 0,
+            'uses_dates': agg['dates'],
+            'uses_underscores': agg['underscores'],
+            'uses_hyphens': agg['hyphens'],
+            'uses_camelCase': agg['camel_case'],
+            'uses_lowercase': agg['lowercase'],
+            'uses_prefixes': [
+                {'prefix': k, 'count': v} 
+                for k, v in Counter(agg['prefixes']).most_common(5)
+            ],
+            'average_length': agg['length'] / total,
         }
         
-        if not renames:
-            return {'learned_patterns': None, 'sample_size': 0}
+        # Determine primary style
+        patterns['primary_separator'] = 'underscore' if patterns['uses_underscores'] > patterns['uses_hyphens'] else 'hyphen'
+        patterns['date_frequency'] = patterns['uses_dates'] / total if total else 0
         
-        lengths = []
-        prefixes = defaultdict(int)
+        return self._cache_store(key, version, {
+            'learned_patterns': patterns,
+            'sample_size': total
+        })
+    
+    @staticmethod
+    def _empty_naming_agg() -> Dict:
+        """Running naming-trait totals over all renames, as kept in stats['naming_agg']"""
+        return {
+            'count': 0,
+            'dates': 0,
+            'underscores': 0,
+            'hyphens': 0,
+            'lowercase': 0,
+            'camel_case': 0,
+            'length': 0,
+            'prefixes': {},
+        }
+    
+    def _rename_names(self) -> List[str]:
+        """Chosen names of all stored renames, oldest first"""
+        cursor = self._db.execute(
+            "SELECT new_name FROM file_accesses "
+            "WHERE access_type = 'rename' AND new_name IS NOT NULL AND new_name != '' "
+            "ORDER BY rowid"
+        )
+        return [name for (name,) in cursor]
+    
+    def _tally_names(self, agg: Dict, names: List[str]):
+        """
+        Add the naming traits of chosen file names to a naming aggregate.
         
-        for rename in renames:
-            name = rename['new_name']
-            
+        Large all-ASCII batches go through the Numba kernel when it is
+        available; otherwise each name is classified in Python.
+        """
+        prefixes = agg['prefixes']
+        agg['count'] += len(names)
+        
+        k = _naming_kernels() if len(names) >= self.NUMBA_MIN_NAMES else None
+        if k is not None:
+            joined = ''.join(names)
+            if joined.isascii():
+                offsets = np.zeros(len(names) + 1, dtype=np.int64)
+                np.cumsum([len(name) for name in names], out=offsets[1:])
+                flags = np.empty((len(names), k.N_COLUMNS), dtype=np.int64)
+                k.analyze_names(np.frombuffer(joined.encode('ascii'), dtype=np.uint8), offsets, flags)
+                
+                totals = flags.sum(axis=0)
+                agg['dates'] += int(totals[k.DATES])
+                agg['underscores'] += int(totals[k.UNDERSCORE])
+                agg['hyphens'] += int(totals[k.HYPHEN])
+                agg['lowercase'] += int(totals[k.LOWERCASE])
+                agg['camel_case'] += int(totals[k.CAMEL_CASE])
+                agg['length'] += int(totals[k.LENGTH])
+                for name, prefix_len in zip(names, flags[:, k.PREFIX_LEN].tolist()):
+                    if prefix_len >= 0:
+                        prefix = name[:prefix_len]
+                        prefixes[prefix] = prefixes.get(prefix, 0) + 1
+                return
+        
+        for name in names:
             # Date patterns (YYYY, YYYYMM, YYYYMMDD)
-            if any(c.isdigit() for c in name) and len([c for c in name if c.isdigit()]) >= 4:
-                patterns['uses_dates'] += 1
+            agg['dates'] += _DATE_RE.search(name) is not None
             
             # Separators
-            if '_' in name:
-                patterns['uses_underscores'] += 1
-            if '-' in name:
-                patterns['uses_hyphens'] += 1
+            agg['underscores'] += '_' in name
+            agg['hyphens'] += '-' in name
             
             # Case patterns
-            if name == name.lower():
-                patterns['uses_lowercase'] += 1
-            if any(c.isupper() for c in name[1:]):  # camelCase check
-                patterns['uses_camelCase'] += 1
+            lowered = name.lower()
+            agg['lowercase'] += name == lowered
+            agg['camel_case'] += name[1:] != lowered[1:]  # Uppercase after the first char
             
             # Prefix detection (first word before separator)
-            for sep in ['_', '-', ' ']:
-                if sep in name:
-                    prefix = name.split(sep)[0]
-                    if len(prefix) < 15:  # Reasonable prefix length
-                        prefixes[prefix] += 1
-                    break
+            match = _PREFIX_RE.match(name)
+            if match:
+                prefix = match.group(match.lastindex)
+                if len(prefix) < 15:  # Reasonable prefix length
+                    prefixes[prefix] = prefixes.get(prefix, 0) + 1
             
-            lengths.append(len(name))
-        
-        patterns['average_length'] = sum(lengths) / len(lengths) if lengths else 0
-        patterns['uses_prefixes'] = [
-            {'prefix': k, 'count': v} 
-            for k, v in sorted(prefixes.items(), key=lambda x: -x[1])[:5]
-        ]
-        
-        # Determine primary style
-        total = len(renames)
-        patterns['primary_separator'] = 'underscore' if patterns['uses_underscores'] > patterns['uses_hyphens'] else 'hyphen'
-        patterns['date_frequency'] = patterns['uses_dates'] / total if total else 0
-        
-        return {
-            'learned_patterns': patterns,
-            'sample_size': len(renames)
-        }
+            agg['length'] += len(name)
     
     def get_suggestion_effectiveness(self) -> Dict:
         """How well are suggestions being received?"""
@@ -445,24 +910,30 @@ class BehaviorTracker:
         rejected = self.stats.get('suggestions_rejected', 0)
         customized = self.stats.get('suggestions_customized', 0)
         
+        key = ('suggestion_effectiveness',)
+        version = (accepted, rejected, customized)
+        cached = self._cache_lookup(key, version)
+        if cached is not None:
+            return cached
+        
         total = accepted + rejected + customized
         
         if total == 0:
-            return {
+            return self._cache_store(key, version, {
                 'total_suggestions': 0,
                 'acceptance_rate': 0,
                 'rejection_rate': 0,
                 'customization_rate': 0,
                 'effective': None  # Not enough data
-            }
+            })
         
-        return {
+        return self._cache_store(key, version, {
             'total_suggestions': total,
             'acceptance_rate': accepted / total,
             'rejection_rate': rejected / total,
             'customization_rate': customized / total,
             'effective': (accepted + customized) / total > 0.5
-        }
+        })
     
     def _calculate_success_rate(self, searches: List[Dict]) -> float:
         """Calculate search success rate"""
@@ -475,7 +946,9 @@ class BehaviorTracker:
     
     def clear_all_data(self):
         """Clear all tracking data (privacy feature)"""
-        self.events = {'searches': [], 'file_accesses': [], 'navigation': [], 'decisions': []}
+        self.events = {category: deque(maxlen=self.EVENT_HISTORY) for category in self.EVENT_KINDS}
+        self._analytics_cache.clear()
+        self.version += 1
         self.sessions = []
         self.stats = {
             'total_searches': 0,
@@ -487,21 +960,67 @@ class BehaviorTracker:
             'suggestions_customized': 0,
             'first_seen': None,
             'last_seen': None,
-            'skill_scores': {}
+            'skill_scores': {},
+            'naming_agg': self._empty_naming_agg()
         }
+        self._event_buffer.clear()
+        for rows in self._pending_rows.values():
+            rows.clear()
+        os.ftruncate(self._events_fd, 0)
+        for category in self.TABLE_COLUMNS:
+            self._db.execute(f"DELETE FROM {category}")
+        self._dirty = dict.fromkeys(self._dirty, True)
         self._save_data()
     
     def export_data(self) -> Dict:
         """Export all data for backup"""
+        # Full history from disk; memory holds only the recent events
+        self._write_events()
+        events = {category: [] for category in self.EVENT_KINDS}
+        for item in self._read_events():
+            if item is not None:
+                events[item[0]].append(item[1])
+        for category in self.TABLE_COLUMNS:
+            events[category] = self._select_rows(category)
+        
         return {
-            'events': self.events,
-            'sessions': self.sessions,
+            'events': {
+                category: self._iso_events(category_events)
+                for category, category_events in events.items()
+            },
+            'sessions': [self._iso_session(session) for session in self.sessions],
             'stats': self.stats,
             'exported_at': datetime.now().isoformat()
         }
     
+    @staticmethod
+    def _iso_events(events: List[Dict]) -> List[Dict]:
+        """Copy events with epoch timestamps formatted as ISO strings"""
+        return [{**event, 'timestamp': _iso(event['timestamp'])} for event in events]
+    
+    def _iso_session(self, session: Dict) -> Dict:
+        """Copy a saved session with its event timestamps formatted as ISO strings"""
+        session = dict(session)
+        for category in self.EVENT_KINDS:
+            events = session.get(category)
+            if isinstance(events, dict):
+                session[category] = {**events, 'timestamp': [_iso(ts) for ts in events['timestamp']]}
+            elif events:
+                session[category] = self._iso_events(events)  # Row-wise, from older versions
+        return session
+    
+    def event_counts(self) -> Dict[str, int]:
+        """Event counts per area, read from the running totals without any query"""
+        return {
+            'search': self.stats['total_searches'],
+            'file': self.stats['total_files_accessed'],
+            'naming': self.stats['naming_agg']['count'],
+            'navigation': len(self.events['navigation']),  # Recent events only
+        }
+    
     def get_summary(self) -> Dict:
         """Get summary of tracked behavior"""
+        self._write_events()
         return {
             'total_searches': self.stats.get('total_searches', 0),
             'search_success_rate': (
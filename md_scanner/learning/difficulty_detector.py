@@ -12,17 +12,35 @@ Detects:
 Outputs skill scores that drive suggestions intensity.
 """
 
+import bisect
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
-import re
-from pathlib import Path
+from collections import Counter, defaultdict, deque
+from itertools import islice
+import sys
+import time
 
 from .behavior_tracker import BehaviorTracker
 
+# dataclass(slots=True) needs Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Skill areas, in report order
+_SKILL_NAMES: Tuple[str, ...] = (
+    "search_ability",
+    "naming_consistency",
+    "folder_organization",
+    "file_management",
+)
+
+
+def _inverse_clip(value: float, limit: float) -> float:
+    """1 - value / limit, bottoming out at 0.0 once value reaches limit"""
+    return 1.0 - value / limit if value < limit else 0.0
+
+
+@dataclass(**_SLOTS)
 class SkillAssessment:
     """Assessment of user's skill in a specific area"""
 
@@ -35,7 +53,7 @@ class SkillAssessment:
     samples_count: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DifficultyReport:
     """Full report of detected difficulties"""
 
@@ -66,38 +84,108 @@ class DifficultyDetector:
     THRESHOLD_LEARNING = 0.7
     THRESHOLD_PROFICIENT = 0.85
 
+    # Suggestion intensity per score band, split at the thresholds above:
+    # (ceiling - score) / width * scale. Scores past the last band are mastered.
+    INTENSITY_BREAKS = (THRESHOLD_STRUGGLING, THRESHOLD_LEARNING, THRESHOLD_PROFICIENT)
+    INTENSITY_BANDS = (
+        (1.0, 1.0, 1.0),  # Struggling - lower score = higher intensity
+        (THRESHOLD_LEARNING, 0.3, 1.0),  # Learning - decreasing intensity
+        (THRESHOLD_PROFICIENT, 0.15, 0.5),  # Proficient - halved intensity
+    )
+
+    # Skill names as shown in messages
+    SKILL_LABELS = {
+        "search_ability": "search ability",
+        "naming_consistency": "naming consistency",
+        "folder_organization": "folder organization",
+        "file_management": "file management",
+    }
+
+    # Assessment scores kept per skill for trend detection
+    TREND_HISTORY = 10
+
+    # Seconds a tracker aggregate or full report is reused while no new events arrive
+    AGGREGATE_TTL = 60.0
+
     def __init__(self, tracker: BehaviorTracker):
         self.tracker = tracker
-        self.skill_history = defaultdict(list)  # Track scores over time
+        # Recent scores per skill, oldest first
+        self.skill_history: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=self.TREND_HISTORY)
+        )
+
+        # (tracker method, args) -> (event counts, expiry, result)
+        self._aggregate_cache: Dict[Tuple, Tuple[Tuple, float, Dict]] = {}
+
+        # Last report, with the tracker version and expiry it is valid for
+        self._last_report: Optional[DifficultyReport] = None
+        self._last_version: Optional[Tuple[int, float]] = None
+
+    def _aggregate(self, method: str, *args) -> Dict:
+        """
+        Call a tracker aggregate query, reusing the last result while the
+        tracker's event counters are unchanged and it is under
+        AGGREGATE_TTL seconds old (the day windows slide with time).
+        """
+        stats = self.tracker.stats
+        snapshot = (
+            stats.get("total_searches", 0),
+            stats.get("successful_searches", 0),
+            stats.get("total_files_accessed", 0),
+            stats.get("suggestions_accepted", 0),
+            stats.get("suggestions_rejected", 0),
+            stats.get("suggestions_customized", 0),
+        )
+        key = (method, args)
+        now = time.monotonic()
+
+        entry = self._aggregate_cache.get(key)
+        if entry is not None and entry[0] == snapshot and now < entry[1]:
+            return entry[2]
+
+        result = getattr(self.tracker, method)(*args)
+        self._aggregate_cache[key] = (snapshot, now + self.AGGREGATE_TTL, result)
+        return result
 
     def assess_all_skills(self) -> DifficultyReport:
-        """Run full skill assessment across all areas"""
+        """
+        Run full skill assessment across all areas.
+
+        The report is reused while the tracker has recorded nothing new, for up
+        to AGGREGATE_TTL seconds; it is shared and must not be mutated.
+        """
+        if (
+            self._last_version is not None
+            and self._last_version[0] == self.tracker.version
+            and time.monotonic() < self._last_version[1]
+        ):
+            return self._last_report
+
+        now = datetime.now().isoformat()  # Shared by every assessment in the report
 
         skills = {
-            "search_ability": self._assess_search_ability(),
-            "naming_consistency": self._assess_naming_consistency(),
-            "folder_organization": self._assess_folder_organization(),
-            "file_management": self._assess_file_management(),
+            "search_ability": self._assess_search_ability(now),
+            "naming_consistency": self._assess_naming_consistency(now),
+            "folder_organization": self._assess_folder_organization(now),
+            "file_management": self._assess_file_management(now),
         }
 
-        # Calculate overall skill
-        valid_skills = [s for s in skills.values() if s.confidence > 0.3]
-        if valid_skills:
-            overall = sum(s.score * s.confidence for s in valid_skills) / sum(
-                s.confidence for s in valid_skills
-            )
-        else:
-            overall = 0.5  # Unknown
+        # Calculate overall skill: confidence-weighted mean of confident skills
+        weighted = 0.0
+        total_confidence = 0.0
+        for s in skills.values():
+            if s.confidence > 0.3:
+                weighted += s.score * s.confidence
+                total_confidence += s.confidence
+        overall = weighted / total_confidence if total_confidence else 0.5  # 0.5 = unknown
 
         # Identify struggles, improvements, regressions
-        struggles = self._identify_struggles(skills)
-        improvements = self._identify_improvements(skills)
-        regressions = self._identify_regressions(skills)
+        struggles, improvements, regressions = self._classify_skills(skills)
 
         # Generate recommendations
         recommendations = self._generate_recommendations(skills, struggles)
 
-        return DifficultyReport(
+        self._last_report = DifficultyReport(
             overall_skill=overall,
             skills=skills,
             struggles=struggles,
@@ -105,12 +193,21 @@ class DifficultyDetector:
             regressions=regressions,
             recommendations=recommendations,
         )
+        self._last_version = (
+            self.tracker.version,
+            time.monotonic() + self.AGGREGATE_TTL,
+        )
+        return self._last_report
 
-    def _assess_search_ability(self) -> SkillAssessment:
+    def _assess_search_ability(self, now: Optional[str] = None) -> SkillAssessment:
         """Assess user's ability to find files via search"""
-        patterns = self.tracker.get_search_patterns(days=30)
-
-        total = patterns["total_searches"]
+        if now is None:
+            now = datetime.now().isoformat()
+        # Skip the windowed query when there are too few searches in total
+        total = self.tracker.event_counts()["search"]
+        if total >= 3:
+            patterns = self._aggregate("get_search_patterns", 30)
+            total = patterns["total_searches"]
         if total < 3:
             return SkillAssessment(
                 skill_name="search_ability",
@@ -118,7 +215,7 @@ class DifficultyDetector:
                 confidence=0.1,
                 trend="new",
                 evidence=["Not enough search data"],
-                last_updated=datetime.now().isoformat(),
+                last_updated=now,
                 samples_count=total,
             )
 
@@ -153,16 +250,15 @@ class DifficultyDetector:
             confidence=min(total / 20, 1.0),  # More samples = more confidence
             trend=trend,
             evidence=evidence,
-            last_updated=datetime.now().isoformat(),
+            last_updated=now,
             samples_count=total,
         )
 
-    def _assess_naming_consistency(self) -> SkillAssessment:
+    def _assess_naming_consistency(self, now: Optional[str] = None) -> SkillAssessment:
         """Assess how consistent user's file naming is"""
-        naming_data = self.tracker.get_naming_preferences()
-        file_patterns = self.tracker.get_file_patterns(days=30)
-
-        sample_size = naming_data.get("sample_size", 0)
+        if now is None:
+            now = datetime.now().isoformat()
+        sample_size = self.tracker.event_counts()["naming"]
         if sample_size < 5:
             return SkillAssessment(
                 skill_name="naming_consistency",
@@ -170,10 +266,11 @@ class DifficultyDetector:
                 confidence=0.1,
                 trend="new",
                 evidence=["Not enough naming data"],
-                last_updated=datetime.now().isoformat(),
+                last_updated=now,
                 samples_count=sample_size,
             )
 
+        naming_data = self._aggregate("get_naming_preferences")
         evidence = []
         patterns = naming_data.get("learned_patterns", {})
 
@@ -210,12 +307,14 @@ class DifficultyDetector:
             confidence=min(sample_size / 15, 1.0),
             trend=trend,
             evidence=evidence,
-            last_updated=datetime.now().isoformat(),
+            last_updated=now,
             samples_count=sample_size,
         )
 
-    def _assess_folder_organization(self) -> SkillAssessment:
+    def _assess_folder_organization(self, now: Optional[str] = None) -> SkillAssessment:
         """Assess how well user organizes files into folders"""
+        if now is None:
+            now = datetime.now().isoformat()
         # Analyze navigation patterns for signs of disorganization
         events = self.tracker.events.get("navigation", [])
         file_accesses = self.tracker.events.get("file_accesses", [])
@@ -227,51 +326,55 @@ class DifficultyDetector:
                 confidence=0.1,
                 trend="new",
                 evidence=["Not enough navigation data"],
-                last_updated=datetime.now().isoformat(),
+                last_updated=now,
                 samples_count=len(events),
             )
 
         evidence = []
 
         # Long navigation times suggest disorganization
-        avg_nav_time = sum(e.get("time_spent_seconds", 0) for e in events[-20:]) / min(
-            len(events), 20
-        )
-        time_score = 1.0 - min(avg_nav_time / 60, 1.0)  # Over 60 seconds is concerning
+        nav_time = 0.0
+        nav_count = 0
+        for e in islice(reversed(events), 20):  # Tracker events are deques
+            nav_time += e.get("time_spent_seconds", 0)
+            nav_count += 1
+        avg_nav_time = nav_time / nav_count
+        time_score = _inverse_clip(avg_nav_time, 60)  # Over 60 seconds is concerning
         evidence.append(f"Avg navigation time: {avg_nav_time:.1f}s")
 
+        # One pass over the last 100 accesses: depth of the last 50 paths,
+        # and the number of distinct folders holding each file type
+        depth_sum = 0
+        depth_count = 0
+        seen = set()  # (file type, folder) pairs
+        type_folders = Counter()
+        for i, access in enumerate(islice(reversed(file_accesses), 100)):
+            path = access.get("file_path", "")
+            if not path:
+                continue
+            # Plain string scans; either separator may appear in stored paths
+            if i < 50:
+                depth_sum += 1 + path.count("/") + path.count("\\")
+                depth_count += 1
+            folder = path[: max(path.rfind("/"), path.rfind("\\"), 0)]
+            pair = (access.get("file_type", ""), folder)
+            if pair not in seen:
+                seen.add(pair)
+                type_folders[pair[0]] += 1
+
         # Deep paths suggest poor organization
-        paths = [
-            a.get("file_path", "") for a in file_accesses[-50:] if a.get("file_path")
-        ]
-        if paths:
-            avg_depth = sum(len(Path(p).parts) for p in paths) / len(paths)
-            depth_score = 1.0 - min(
-                (avg_depth - 3) / 7, 1.0
-            )  # 3 levels is normal, 10+ is bad
+        if depth_count:
+            avg_depth = depth_sum / depth_count
+            depth_score = _inverse_clip(avg_depth - 3, 7)  # 3 levels is normal, 10+ is bad
             evidence.append(f"Avg folder depth: {avg_depth:.1f}")
         else:
             depth_score = 0.5
 
         # File scatter (same types in many different folders)
-        folder_to_types = defaultdict(set)
-        for access in file_accesses[-100:]:
-            path = access.get("file_path", "")
-            if path:
-                folder = str(Path(path).parent)
-                file_type = access.get("file_type", "")
-                folder_to_types[folder].add(file_type)
-
         # Many folders with same file type = scattered
-        if folder_to_types:
-            type_folders = defaultdict(int)
-            for folder, types in folder_to_types.items():
-                for t in types:
-                    type_folders[t] += 1
-            max_scatter = max(type_folders.values()) if type_folders else 1
-            scatter_score = 1.0 - min(
-                (max_scatter - 3) / 10, 1.0
-            )  # Up to 3 folders per type is OK
+        if type_folders:
+            max_scatter = max(type_folders.values())
+            scatter_score = _inverse_clip(max_scatter - 3, 10)  # Up to 3 folders per type is OK
             evidence.append(f"Max file type scatter: {max_scatter} folders")
         else:
             scatter_score = 0.5
@@ -285,16 +388,19 @@ class DifficultyDetector:
             confidence=min(len(events) / 20, 1.0),
             trend=trend,
             evidence=evidence,
-            last_updated=datetime.now().isoformat(),
+            last_updated=now,
             samples_count=len(events),
         )
 
-    def _assess_file_management(self) -> SkillAssessment:
+    def _assess_file_management(self, now: Optional[str] = None) -> SkillAssessment:
         """Assess overall file management skills"""
-        file_patterns = self.tracker.get_file_patterns(days=30)
-        suggestion_effectiveness = self.tracker.get_suggestion_effectiveness()
-
-        total = file_patterns["total_accesses"]
+        if now is None:
+            now = datetime.now().isoformat()
+        # Skip the windowed query when there are too few accesses in total
+        total = self.tracker.event_counts()["file"]
+        if total >= 5:
+            file_patterns = self._aggregate("get_file_patterns", 30)
+            total = file_patterns["total_accesses"]
         if total < 5:
             return SkillAssessment(
                 skill_name="file_management",
@@ -302,19 +408,18 @@ class DifficultyDetector:
                 confidence=0.1,
                 trend="new",
                 evidence=["Not enough file access data"],
-                last_updated=datetime.now().isoformat(),
+                last_updated=now,
                 samples_count=total,
             )
 
+        suggestion_effectiveness = self._aggregate("get_suggestion_effectiveness")
         evidence = []
 
         # Rename frequency (low is better - means files named well initially)
         renames = file_patterns["by_access_type"].get("rename", 0)
         opens = file_patterns["by_access_type"].get("open", 1)
         rename_ratio = renames / max(opens, 1)
-        rename_score = 1.0 - min(
-            rename_ratio / 0.3, 1.0
-        )  # 30% rename ratio is very high
+        rename_score = _inverse_clip(rename_ratio, 0.3)  # 30% rename ratio is very high
         evidence.append(f"Rename ratio: {rename_ratio:.0%}")
 
         # Suggestion acceptance (shows learning)
@@ -346,31 +451,24 @@ class DifficultyDetector:
             confidence=min(total / 30, 1.0),
             trend=trend,
             evidence=evidence,
-            last_updated=datetime.now().isoformat(),
+            last_updated=now,
             samples_count=total,
         )
 
     def _calculate_trend(self, skill_name: str, current_score: float) -> str:
         """Determine if skill is improving, stable, or regressing"""
         history = self.skill_history[skill_name]
+        history.append(current_score)  # Oldest score drops off
 
-        # Store current score
-        history.append(
-            {"score": current_score, "timestamp": datetime.now().isoformat()}
-        )
-
-        # Keep only last 10 assessments
-        self.skill_history[skill_name] = history[-10:]
-
-        if len(history) < 3:
+        count = len(history)
+        if count < 3:
             return "new"
 
         # Compare recent (last 3) vs older (before that)
-        recent = [h["score"] for h in history[-3:]]
-        older = [h["score"] for h in history[:-3]] if len(history) > 3 else recent
-
-        recent_avg = sum(recent) / len(recent)
-        older_avg = sum(older) / len(older)
+        recent_avg = (history[-3] + history[-2] + history[-1]) / 3
+        older_avg = (
+            sum(islice(history, count - 3)) / (count - 3) if count > 3 else recent_avg
+        )
 
         diff = recent_avg - older_avg
 
@@ -381,9 +479,19 @@ class DifficultyDetector:
         else:
             return "stable"
 
-    def _identify_struggles(self, skills: Dict[str, SkillAssessment]) -> List[Dict]:
-        """Identify current areas of struggle"""
+    def _classify_skills(
+        self, skills: Dict[str, SkillAssessment]
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Identify current struggles, areas of improvement, and areas getting
+        worse (need to re-engage) in one pass.
+
+        Returns:
+            Tuple of (struggles sorted by score, improvements, regressions)
+        """
         struggles = []
+        improvements = []
+        regressions = []
 
         for name, assessment in skills.items():
             if (
@@ -399,40 +507,26 @@ class DifficultyDetector:
                     }
                 )
 
-        return sorted(struggles, key=lambda x: x["score"])
-
-    def _identify_improvements(self, skills: Dict[str, SkillAssessment]) -> List[Dict]:
-        """Identify areas where user is improving"""
-        improvements = []
-
-        for name, assessment in skills.items():
             if assessment.trend == "improving":
                 improvements.append(
                     {
                         "skill": name,
                         "current_score": assessment.score,
-                        "message": f"Great progress on {name.replace('_', ' ')}!",
+                        "message": f"Great progress on {self.SKILL_LABELS[name]}!",
                     }
                 )
-
-        return improvements
-
-    def _identify_regressions(self, skills: Dict[str, SkillAssessment]) -> List[Dict]:
-        """Identify areas getting worse (need to re-engage)"""
-        regressions = []
-
-        for name, assessment in skills.items():
-            if assessment.trend == "regressing" and assessment.confidence > 0.4:
+            elif assessment.trend == "regressing" and assessment.confidence > 0.4:
                 regressions.append(
                     {
                         "skill": name,
                         "current_score": assessment.score,
-                        "message": f"Noticed some regression in {name.replace('_', ' ')}. Let me help!",
+                        "message": f"Noticed some regression in {self.SKILL_LABELS[name]}. Let me help!",
                         "should_increase_suggestions": True,
                     }
                 )
 
-        return regressions
+        struggles.sort(key=lambda x: x["score"])
+        return struggles, improvements, regressions
 
     def _generate_recommendations(
         self, skills: Dict[str, SkillAssessment], struggles: List[Dict]
@@ -469,33 +563,42 @@ class DifficultyDetector:
                 )
 
         # Add encouraging message for improvements
-        improving = [s for s in skills.values() if s.trend == "improving"]
+        improving = next(
+            (name for name, s in skills.items() if s.trend == "improving"), None
+        )
         if improving:
-            skill_name = improving[0].skill_name.replace("_", " ")
             recommendations.append(
-                f"You're getting better at {skill_name}! Keep it up."
+                f"You're getting better at {self.SKILL_LABELS[improving]}! Keep it up."
             )
 
         return recommendations
 
-    def should_show_suggestions(self, skill_name: str) -> Tuple[bool, float]:
+    def should_show_suggestions(
+        self, skill_name: str, report: Optional[DifficultyReport] = None
+    ) -> Tuple[bool, float]:
         """
         Determine if suggestions should be shown for this skill area.
         Returns (should_show, intensity) where intensity is 0.0 to 1.0
 
+        Pass a report from assess_all_skills() to decide several skills
+        without re-assessing for each one.
+
         Logic:
         - Low skill + high confidence = SHOW with high intensity
         - High skill + stable trend = DON'T show (fade out)
         - High skill + regressing trend = SHOW again (catch regression)
         - New user = SHOW with medium intensity (onboarding)
         """
-        report = self.assess_all_skills()
+        if report is None:
+            report = self.assess_all_skills()
 
         if skill_name not in report.skills:
             return True, 0.5  # Unknown skill, show with medium intensity
 
-        assessment = report.skills[skill_name]
+        return self._intensity_for(report.skills[skill_name])
 
+    def _intensity_for(self, assessment: SkillAssessment) -> Tuple[bool, float]:
+        """Suggestion visibility and intensity for one skill assessment"""
         # New user - show suggestions gently
         if assessment.trend == "new":
             return True, 0.5
@@ -506,33 +609,21 @@ class DifficultyDetector:
             intensity = 1.0 - assessment.score
             return True, min(intensity * 1.2, 1.0)  # Boost intensity for regressions
 
-        # Struggling - definitely show
-        if assessment.score < self.THRESHOLD_STRUGGLING:
-            intensity = 1.0 - assessment.score  # Lower score = higher intensity
-            return True, intensity
-
-        # Learning - show with decreasing intensity
-        if assessment.score < self.THRESHOLD_LEARNING:
-            intensity = (self.THRESHOLD_LEARNING - assessment.score) / 0.3
-            return True, intensity
-
-        # Proficient - minimal suggestions
-        if assessment.score < self.THRESHOLD_PROFICIENT:
-            intensity = (self.THRESHOLD_PROFICIENT - assessment.score) / 0.15
-            return True, intensity * 0.5  # Halve intensity for proficient users
+        # Struggling, learning or proficient - show, less as the score rises
+        band = bisect.bisect_right(self.INTENSITY_BREAKS, assessment.score)
+        if band < len(self.INTENSITY_BANDS):
+            ceiling, width, scale = self.INTENSITY_BANDS[band]
+            return True, (ceiling - assessment.score) / width * scale
 
         # Mastered - don't show unless asked
         return False, 0.0
 
     def get_suggestion_intensity(self) -> Dict[str, float]:
         """Get suggestion intensity for all skills"""
-        intensities = {}
-        for skill in [
-            "search_ability",
-            "naming_consistency",
-            "folder_organization",
-            "file_management",
-        ]:
-            show, intensity = self.should_show_suggestions(skill)
-            intensities[skill] = intensity if show else 0.0
-        return intensities
+        report = self.assess_all_skills()  # One assessment for all skills
+
+        # Hidden skills come back as (False, 0.0), so the intensity is enough
+        skills = report.skills
+        return {
+            skill: self._intensity_for(skills[skill])[1] for skill in _SKILL_NAMES
+        }
@@ -0,0 +1,85 @@
+"""
+Numba kernels for rename-history analysis.
+
+Importing this module requires numba; BehaviorTracker treats ImportError
+as "kernels unavailable" and analyzes names in pure Python.
+"""
+import numpy as np
+from numba import njit, prange
+
+# Columns of the analyze_names output
+DATES, UNDERSCORE, HYPHEN, LOWERCASE, CAMEL_CASE, LENGTH, PREFIX_LEN = range(7)
+N_COLUMNS = 7
+
+# Prefixes at least this long are not counted
+MAX_PREFIX = 15
+
+_UNDERSCORE = ord('_')
+_HYPHEN = ord('-')
+_SPACE = ord(' ')
+
+
+@njit(parallel=True, cache=True)
+def analyze_names(buf: np.ndarray, offsets: np.ndarray, out: np.ndarray) -> None:
+    """
+    Classify each name of a packed ASCII buffer in one sweep.
+
+    For name i (bytes offsets[i]:offsets[i + 1]) writes into out[i]: four or
+    more digits, contains '_', contains '-', has no uppercase, has uppercase
+    after the first character, length, and the length of the prefix before
+    the first separator (checked in '_', '-', ' ' order), or -1 if there is
+    none or it is MAX_PREFIX or longer.
+
+    Args:
+        buf: (total_bytes,) uint8 concatenated names
+        offsets: (N + 1,) int64 name boundaries
+        out: (N, N_COLUMNS) int64 array receiving the flags
+    """
+    for i in prange(offsets.shape[0] - 1):
+        start = offsets[i]
+        end = offsets[i + 1]
+        digits = 0
+        upper = 0
+        upper_after_first = 0
+        first_underscore = -1
+        first_hyphen = -1
+        first_space = -1
+        for j in range(start, end):
+            c = buf[j]
+            if 48 <= c <= 57:
+                digits += 1
+            elif 65 <= c <= 90:
+                upper = 1
+                if j > start:
+                    upper_after_first = 1
+            elif c == _UNDERSCORE:
+                if first_underscore < 0:
+                    first_underscore = j - start
+            elif c == _HYPHEN:
+                if first_hyphen < 0:
+                    first_hyphen = j - start
+            elif c == _SPACE:
+                if first_space < 0:
+                    first_space = j - start
+
+        prefix = first_underscore
+        if prefix < 0:
+            prefix = first_hyphen
+        if prefix < 0:
+            prefix = first_space
+
+        out[i, DATES] = digits >= 4
+        out[i, UNDERSCORE] = first_underscore >= 0
+        out[i, HYPHEN] = first_hyphen >= 0
+        out[i, LOWERCASE] = upper == 0
+        out[i, CAMEL_CASE] = upper_after_first
+        out[i, LENGTH] = end - start
+        out[i, PREFIX_LEN] = prefix if prefix < MAX_PREFIX else -1
+
+
+# Compile (or load from cache) when first imported, ahead of the first real call
+analyze_names(
+    np.frombuffer(b'a_b', dtype=np.uint8),
+    np.array([0, 3], dtype=np.int64),
+    np.empty((1, N_COLUMNS), dtype=np.int64)
+)
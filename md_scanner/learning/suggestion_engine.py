@@ -18,11 +18,98 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+import functools
 import re
 import os
 
 from .behavior_tracker import BehaviorTracker
 
+# Deletes characters not allowed in filenames (str.translate table)
+_INVALID_FN_TABLE = str.maketrans("", "", '<>:"/\\|?*')
+
+# Runs of characters that become a single separator
+_FN_SEPS = re.compile(r"[\s\-\.]+")
+
+# File type for each lowercased extension (without the dot)
+_EXT_TO_TYPE = {
+    "docx": "document",
+    "doc": "document",
+    "pdf": "document",
+    "txt": "document",
+    "md": "document",
+    "rtf": "document",
+    "odt": "document",
+    "xlsx": "spreadsheet",
+    "xls": "spreadsheet",
+    "csv": "spreadsheet",
+    "ods": "spreadsheet",
+    "pptx": "presentation",
+    "ppt": "presentation",
+    "odp": "presentation",
+    "py": "code",
+    "js": "code",
+    "ts": "code",
+    "java": "code",
+    "cpp": "code",
+    "c": "code",
+    "go": "code",
+    "rs": "code",
+    "jpg": "image",
+    "jpeg": "image",
+    "png": "image",
+    "gif": "image",
+    "svg": "image",
+    "webp": "image",
+}
+
+# Category implied by a keyword appearing in a topic
+_TOPIC_CATEGORIES = {
+    "meeting": "meetings",
+    "notes": "notes",
+    "report": "reports",
+    "budget": "finance",
+    "invoice": "finance",
+    "design": "design",
+    "test": "tests",
+    "readme": "documentation",
+    "config": "config",
+}
+
+# Fallback category for each file type
+_TYPE_CATEGORIES = {
+    "document": "documents",
+    "spreadsheet": "data",
+    "presentation": "presentations",
+    "code": "code",
+    "image": "images",
+}
+
+# Naming convention for each file type when the user has no strong preference
+_TYPE_CONVENTIONS = {
+    "document": "date_prefix",
+    "code": "semantic",
+    "spreadsheet": "category_first",
+    "image": "semantic",
+    "presentation": "project_based",
+}
+
+# Filename prefix for each category
+_CATEGORY_PREFIX = {
+    "documents": "DOCS",
+    "data": "DATA",
+    "presentations": "PRES",
+    "code": "CODE",
+    "images": "IMG",
+    "meetings": "MTG",
+    "notes": "NOTES",
+    "reports": "RPT",
+    "finance": "FIN",
+    "design": "DSGN",
+    "tests": "TEST",
+    "documentation": "DOCS",
+    "config": "CFG",
+}
+
 
 @dataclass
 class NamingSuggestion:
@@ -140,6 +227,11 @@ class SuggestionEngine:
 
         # Load user's learned conventions
         self.user_conventions = self._learn_user_conventions()
+        self._uses_dates = bool(self.user_conventions.get("uses_dates"))
+        self._has_prefixes = bool(self.user_conventions.get("common_prefixes"))
+
+        # base_directory -> (mtime, {folder: mtime}, folder analysis)
+        self._folder_cache: Dict[str, Tuple[int, Dict[str, int], Tuple]] = {}
 
     def _learn_user_conventions(self) -> Dict:
         """Learn naming conventions from user's actual files"""
@@ -172,6 +264,7 @@ class SuggestionEngine:
         file_path: str,
         content_analysis: Optional[Dict] = None,
         force_convention: Optional[str] = None,
+        with_alternatives: bool = True,
     ) -> NamingSuggestion:
         """
         Generate a filename suggestion based on content and user patterns.
@@ -180,12 +273,14 @@ class SuggestionEngine:
             file_path: Current file path
             content_analysis: Dict with 'title', 'topics', 'type', etc.
             force_convention: Force a specific naming convention
+            with_alternatives: Also name the file under the other conventions
+                (alternatives is left empty when False)
 
         Returns:
             NamingSuggestion with primary suggestion and alternatives
         """
-        original_name = Path(file_path).stem
-        extension = Path(file_path).suffix
+        root, extension = os.path.splitext(file_path)
+        original_name = os.path.basename(root)
 
         # Extract content info
         if content_analysis:
@@ -205,25 +300,31 @@ class SuggestionEngine:
         else:
             convention = self._choose_convention(file_type, topics)
 
+        # Clean the inputs once; each convention only formats them
+        cleaned = self._clean_inputs(title, topics, file_type)
+        sep = self.user_conventions.get("separator", "_")
+        date = date_hint or datetime.now().strftime("%Y%m%d")
+
         # Generate name based on convention
-        suggested = self._apply_convention(
+        suggested = self._format_convention(
             convention=convention,
-            title=title,
-            topics=topics,
+            cleaned=cleaned,
             file_type=file_type,
-            date=date_hint or datetime.now().strftime("%Y%m%d"),
+            date=date,
+            sep=sep,
         )
 
         # Generate alternatives with other conventions
         alternatives = []
-        for alt_convention in self.NAMING_CONVENTIONS:
+        alt_conventions = self.NAMING_CONVENTIONS if with_alternatives else ()
+        for alt_convention in alt_conventions:
             if alt_convention != convention:
-                alt_name = self._apply_convention(
+                alt_name = self._format_convention(
                     convention=alt_convention,
-                    title=title,
-                    topics=topics,
+                    cleaned=cleaned,
                     file_type=file_type,
-                    date=date_hint or datetime.now().strftime("%Y%m%d"),
+                    date=date,
+                    sep=sep,
                 )
                 if alt_name != suggested:
                     alternatives.append(alt_name + extension)
@@ -264,7 +365,7 @@ class SuggestionEngine:
             FolderSuggestion with recommended location
         """
         original_path = str(Path(file_path).parent)
-        extension = Path(file_path).suffix
+        extension = os.path.splitext(file_path)[1]
 
         # Get file type
         file_type = (
@@ -273,7 +374,9 @@ class SuggestionEngine:
         category = self._detect_category(file_type, [], extension)
 
         # Check user's existing folder structure
-        existing_folders = self._analyze_existing_folders(base_directory)
+        _, ext_to_folder, lower_names, category_folders = (
+            self._analyze_existing_folders(base_directory)
+        )
 
         # Find best matching folder
         suggested_path, reasoning, creates_new = self._find_best_folder(
@@ -281,7 +384,9 @@ class SuggestionEngine:
             category=category,
             file_type=file_type,
             extension=extension,
-            existing_folders=existing_folders,
+            ext_to_folder=ext_to_folder,
+            lower_names=lower_names,
+            category_folders=category_folders,
             content_analysis=content_analysis,
         )
 
@@ -377,16 +482,37 @@ class SuggestionEngine:
                 priority=1,
             )
 
-    def _apply_convention(
-        self, convention: str, title: str, topics: List[str], file_type: str, date: str
-    ) -> str:
-        """Apply a naming convention to generate a filename"""
+    def _clean_inputs(
+        self, title: str, topics: List[str], file_type: str
+    ) -> Tuple[str, str, str, str]:
+        """
+        Clean the pieces the naming conventions are built from.
+
+        Done once per file so the regex work is shared by every convention.
 
-        # Clean the title
+        Returns:
+            (clean_title, clean_topic, category_prefix, clean_project)
+        """
         clean_title = self._clean_for_filename(title)
+        if topics:
+            clean_topic = clean_project = self._clean_for_filename(topics[0])
+        else:
+            clean_topic = self._clean_for_filename("general")
+            clean_project = self._clean_for_filename("misc")
+        category = self._infer_category_prefix(file_type, topics)
 
-        # Get separator from user preferences or default
-        sep = self.user_conventions.get("separator", "_")
+        return clean_title, clean_topic, category, clean_project
+
+    def _format_convention(
+        self,
+        convention: str,
+        cleaned: Tuple[str, str, str, str],
+        file_type: str,
+        date: str,
+        sep: str,
+    ) -> str:
+        """Apply a naming convention to inputs from _clean_inputs"""
+        clean_title, topic, category, project = cleaned
 
         if convention == "date_prefix":
             # YYYYMMDD_description
@@ -394,15 +520,10 @@ class SuggestionEngine:
 
         elif convention == "category_first":
             # CATEGORY_topic_description
-            category = self._infer_category_prefix(file_type, topics)
-            topic = topics[0] if topics else "general"
-            topic = self._clean_for_filename(topic)
             return f"{category}{sep}{topic}{sep}{clean_title}"
 
         elif convention == "project_based":
             # project_type_description
-            project = topics[0] if topics else "misc"
-            project = self._clean_for_filename(project)
             return f"{project}{sep}{file_type}{sep}{clean_title}"
 
         elif convention == "semantic":
@@ -418,11 +539,11 @@ class SuggestionEngine:
             return "untitled"
 
         # Remove invalid characters
-        text = re.sub(r'[<>:"/\\|?*]', "", text)
+        text = text.translate(_INVALID_FN_TABLE)
 
         # Replace spaces and special chars with separator
         sep = self.user_conventions.get("separator", "_")
-        text = re.sub(r"[\s\-\.]+", sep, text)
+        text = _FN_SEPS.sub(sep, text)
 
         # Apply case convention
         case_style = self.user_conventions.get("case_style", "lowercase")
@@ -430,7 +551,7 @@ class SuggestionEngine:
             text = text.lower()
 
         # Trim to reasonable length
-        max_len = min(self.user_conventions.get("avg_length", 50), 100)
+        max_len = int(min(self.user_conventions.get("avg_length", 50), 100))
         if len(text) > max_len:
             text = text[:max_len].rsplit(sep, 1)[0]  # Cut at last separator
 
@@ -440,129 +561,95 @@ class SuggestionEngine:
         """Choose best naming convention for this file"""
 
         # Check if user has strong preferences from their patterns
-        if self.user_conventions.get("uses_dates"):
+        if self._uses_dates:
             return "date_prefix"
 
-        if self.user_conventions.get("common_prefixes"):
+        if self._has_prefixes:
             return "category_first"
 
         # Otherwise, choose based on file type
-        type_conventions = {
-            "document": "date_prefix",
-            "code": "semantic",
-            "spreadsheet": "category_first",
-            "image": "semantic",
-            "presentation": "project_based",
-        }
-
-        return type_conventions.get(file_type, "category_first")
+        return _TYPE_CONVENTIONS.get(file_type, "category_first")
 
-    def _infer_type_from_extension(self, extension: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _infer_type_from_extension(extension: str) -> str:
         """Infer file type from extension"""
-        ext = extension.lower().lstrip(".")
-
-        type_map = {
-            "docx": "document",
-            "doc": "document",
-            "pdf": "document",
-            "txt": "document",
-            "md": "document",
-            "rtf": "document",
-            "odt": "document",
-            "xlsx": "spreadsheet",
-            "xls": "spreadsheet",
-            "csv": "spreadsheet",
-            "ods": "spreadsheet",
-            "pptx": "presentation",
-            "ppt": "presentation",
-            "odp": "presentation",
-            "py": "code",
-            "js": "code",
-            "ts": "code",
-            "java": "code",
-            "cpp": "code",
-            "c": "code",
-            "go": "code",
-            "rs": "code",
-            "jpg": "image",
-            "jpeg": "image",
-            "png": "image",
-            "gif": "image",
-            "svg": "image",
-            "webp": "image",
-        }
-
-        return type_map.get(ext, "file")
+        return _EXT_TO_TYPE.get(extension.lower().lstrip("."), "file")
 
     def _detect_category(
         self, file_type: str, topics: List[str], extension: str
     ) -> str:
         """Detect category for the file"""
-        # Check topics for hints
-        topic_categories = {
-            "meeting": "meetings",
-            "notes": "notes",
-            "report": "reports",
-            "budget": "finance",
-            "invoice": "finance",
-            "design": "design",
-            "test": "tests",
-            "readme": "documentation",
-            "config": "config",
-        }
+        return self._category_for(file_type, tuple(topics))
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _category_for(file_type: str, topics: Tuple[str, ...]) -> str:
+        """Cached core of _detect_category (the extension does not affect it)"""
+        # Check topics for hints
         for topic in topics:
             topic_lower = topic.lower()
-            for keyword, category in topic_categories.items():
+            for keyword, category in _TOPIC_CATEGORIES.items():
                 if keyword in topic_lower:
                     return category
 
         # Fall back to file type
-        type_categories = {
-            "document": "documents",
-            "spreadsheet": "data",
-            "presentation": "presentations",
-            "code": "code",
-            "image": "images",
-        }
-
-        return type_categories.get(file_type, "misc")
+        return _TYPE_CATEGORIES.get(file_type, "misc")
 
     def _infer_category_prefix(self, file_type: str, topics: List[str]) -> str:
         """Generate a category prefix like DOCS, CODE, etc."""
         category = self._detect_category(file_type, topics, "")
 
-        prefix_map = {
-            "documents": "DOCS",
-            "data": "DATA",
-            "presentations": "PRES",
-            "code": "CODE",
-            "images": "IMG",
-            "meetings": "MTG",
-            "notes": "NOTES",
-            "reports": "RPT",
-            "finance": "FIN",
-            "design": "DSGN",
-            "tests": "TEST",
-            "documentation": "DOCS",
-            "config": "CFG",
-        }
+        return _CATEGORY_PREFIX.get(category, "MISC")
 
-        return prefix_map.get(category, "MISC")
+    def _analyze_existing_folders(
+        self, base_directory: str
+    ) -> Tuple[
+        Dict[str, List[str]],
+        Dict[str, str],
+        List[Tuple[str, str]],
+        Dict[str, Optional[str]],
+    ]:
+        """
+        Analyze existing folder structure.
+
+        Results are cached per base directory and reused while the mtimes of
+        the base and of every folder in it are unchanged (adding or removing
+        a file changes its folder's mtime).
 
-    def _analyze_existing_folders(self, base_directory: str) -> Dict[str, List[str]]:
-        """Analyze existing folder structure"""
+        Returns:
+            (folder name -> extensions, extension -> first folder holding it,
+            (lowercased name, name) per folder, category -> matching folder
+            memo filled in by _find_best_folder)
+        """
         base = Path(base_directory)
-        folder_contents = {}
 
-        if not base.exists():
-            return folder_contents
+        try:
+            base_mtime = base.stat().st_mtime_ns
+        except OSError:
+            return {}, {}, [], {}
+
+        cached = self._folder_cache.get(base_directory)
+        if cached is not None and cached[0] == base_mtime:
+            _, folder_mtimes, analysis = cached
+            try:
+                if all(
+                    (base / name).stat().st_mtime_ns == mtime
+                    for name, mtime in folder_mtimes.items()
+                ):
+                    return analysis
+            except OSError:
+                pass
+
+        folder_contents = {}
+        folder_mtimes = {}
 
         for folder in base.iterdir():
             if folder.is_dir() and not folder.name.startswith("."):
                 # Get file extensions in this folder
                 extensions = set()
                 try:
+                    folder_mtimes[folder.name] = folder.stat().st_mtime_ns
                     for f in folder.iterdir():
                         if f.is_file():
                             extensions.add(f.suffix.lower())
@@ -571,7 +658,17 @@ class SuggestionEngine:
 
                 folder_contents[folder.name] = list(extensions)
 
-        return folder_contents
+        # Inverted once so each file's extension match is a single lookup
+        ext_to_folder = {}
+        for name, extensions in folder_contents.items():
+            for ext in extensions:
+                ext_to_folder.setdefault(ext, name)
+
+        lower_names = [(name.lower(), name) for name in folder_contents]
+
+        analysis = (folder_contents, ext_to_folder, lower_names, {})
+        self._folder_cache[base_directory] = (base_mtime, folder_mtimes, analysis)
+        return analysis
 
     def _find_best_folder(
         self,
@@ -579,30 +676,39 @@ class SuggestionEngine:
         category: str,
         file_type: str,
         extension: str,
-        existing_folders: Dict[str, List[str]],
+        ext_to_folder: Dict[str, str],
+        lower_names: List[Tuple[str, str]],
+        category_folders: Dict[str, Optional[str]],
         content_analysis: Optional[Dict],
     ) -> Tuple[str, str, bool]:
         """Find or suggest the best folder for a file"""
         base = Path(base_directory)
 
         # First, try to match by extension
-        for folder_name, extensions in existing_folders.items():
-            if extension.lower() in extensions:
-                return (
-                    str(base / folder_name),
-                    f"Matches existing folder for {extension} files",
-                    False,
-                )
+        folder_name = ext_to_folder.get(extension.lower())
+        if folder_name is not None:
+            return (
+                str(base / folder_name),
+                f"Matches existing folder for {extension} files",
+                False,
+            )
 
-        # Second, try to match by category name
-        category_matches = [
-            name
-            for name in existing_folders
-            if category.lower() in name.lower() or name.lower() in category.lower()
-        ]
-        if category_matches:
+        # Second, try to match by category name (each category is only
+        # compared against the folder names once per analysis)
+        if category not in category_folders:
+            category_lower = category.lower()
+            category_folders[category] = next(
+                (
+                    name
+                    for lower, name in lower_names
+                    if category_lower in lower or lower in category_lower
+                ),
+                None,
+            )
+        folder_name = category_folders[category]
+        if folder_name is not None:
             return (
-                str(base / category_matches[0]),
+                str(base / folder_name),
                 f"Matches category '{category}'",
                 False,
             )
@@ -654,22 +760,34 @@ class SuggestionEngine:
     # === Batch Suggestions ===
 
     def suggest_batch_rename(
-        self, files: List[str], common_convention: Optional[str] = None
+        self,
+        files: List[str],
+        common_convention: Optional[str] = None,
+        preview_only: bool = False,
     ) -> List[NamingSuggestion]:
-        """Generate suggestions for multiple files at once"""
+        """
+        Generate suggestions for multiple files at once.
+
+        With preview_only, only the primary names are generated (each
+        suggestion's alternatives list is empty).
+        """
         suggestions = []
 
         # If no convention specified, analyze files to determine best one
         if not common_convention:
-            extensions = [Path(f).suffix for f in files]
+            # Only the first file's extension is consulted
             file_type = (
-                self._infer_type_from_extension(extensions[0]) if extensions else "file"
+                self._infer_type_from_extension(os.path.splitext(files[0])[1])
+                if files
+                else "file"
             )
             common_convention = self._choose_convention(file_type, [])
 
         for file_path in files:
             suggestion = self.suggest_filename(
-                file_path=file_path, force_convention=common_convention
+                file_path=file_path,
+                force_convention=common_convention,
+                with_alternatives=not preview_only,
             )
             suggestions.append(suggestion)
 
@@ -682,7 +800,7 @@ class SuggestionEngine:
         structure = {}
 
         for file_path in files:
-            extension = Path(file_path).suffix.lower()
+            extension = os.path.splitext(file_path)[1].lower()
             file_type = self._infer_type_from_extension(extension)
             category = self._detect_category(file_type, [], extension)
 
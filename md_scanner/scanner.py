@@ -2,14 +2,20 @@
 File scanner for discovering and indexing markdown files.
 """
 import os
-import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-import re
+from typing import List, Dict, Any, FrozenSet, Optional
+from dataclasses import dataclass, fields
+from operator import attrgetter
 
-@dataclass
+from md_scanner import jsonio
+
+# Scans create one FileMetadata per file; slots drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class FileMetadata:
     """Metadata for a markdown file."""
     path: str
@@ -19,44 +25,59 @@ class FileMetadata:
     size: int
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'path': self.path,
+            'name': self.name,
+            'created_time': self.created_time,
+            'modified_time': self.modified_time,
+            'size': self.size
+        }
 
 class FileScanner:
     """Scanner for discovering markdown files in a directory tree."""
 
-    # Patterns to exclude (noisy files)
-    EXCLUDE_PATTERNS = [
-        r'\.venv[\\/]',
-        r'venv[\\/]',
-        r'env[\\/]',
-        r'\.conda[\\/]',
-        r'site-packages[\\/]',
-        r'\.dist-info[\\/]',
-        r'__pycache__[\\/]',
-        r'\.pytest_cache[\\/]',
-        r'node_modules[\\/]',
-        r'^LICENSE\.md$',
-        r'^README\.md$',
-        r'\.egg-info[\\/]',
-    ]
+    # Threads walking top-level subdirectories concurrently during a scan
+    SCAN_WORKERS = 8
+
+    # Index rows are stored as arrays in this column order
+    INDEX_COLUMNS = tuple(field.name for field in fields(FileMetadata))
+
+    # Directories whose (case-insensitive) name ends with one of these are
+    # pruned from the walk along with everything below them
+    EXCLUDE_DIR_SUFFIXES = (
+        '.venv',
+        'venv',
+        'env',
+        '.conda',
+        'site-packages',
+        '.dist-info',
+        '__pycache__',
+        '.pytest_cache',
+        'node_modules',
+        '.egg-info',
+    )
+
+    # Noisy files skipped at the top level of the scan root (lowercased names)
+    EXCLUDE_ROOT_FILES = frozenset({'license.md', 'readme.md'})
 
     def __init__(self, index_dir: Optional[str] = None):
         """Initialize scanner with optional index directory."""
         self.index_dir = Path(index_dir) if index_dir else Path.home() / '.md_index'
         self.index_dir.mkdir(parents=True, exist_ok=True)
         self.index_file = self.index_dir / 'files.json'
+        self.summary_file = self.index_dir / 'files_summary.json'
 
-    def _should_exclude(self, path: str) -> bool:
-        """Check if path matches any exclusion patterns."""
-        for pattern in self.EXCLUDE_PATTERNS:
-            if re.search(pattern, path, re.IGNORECASE):
-                return True
-        return False
+    def _should_exclude_dir(self, name: str) -> bool:
+        """Check if a directory name marks a subtree to skip."""
+        return name.lower().endswith(self.EXCLUDE_DIR_SUFFIXES)
 
     def scan(self, root_dir: str, progress_callback=None) -> List[FileMetadata]:
         """
         Recursively scan directory for markdown files.
 
+        Top-level subdirectories are walked concurrently: scandir and stat
+        release the GIL, so a thread pool keeps the disk busy on wide trees.
+
         Args:
             root_dir: Root directory to scan
             progress_callback: Optional callback(current_count) for progress updates
@@ -69,52 +90,159 @@ class FileScanner:
             raise ValueError(f"Directory does not exist: {root_dir}")
 
         files = []
-        count = 0
+        subdirs = []
+        self._scan_directory(
+            str(root_path.absolute()), files, subdirs, self.EXCLUDE_ROOT_FILES
+        )
+        self._report_progress(progress_callback, 0, len(files))
+
+        max_workers = max(1, min(self.SCAN_WORKERS, len(subdirs)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Subtrees are merged, and progress reported from this thread,
+            # in submission order as they finish
+            for subtree in executor.map(self._walk, subdirs):
+                self._report_progress(progress_callback, len(files), len(subtree))
+                files.extend(subtree)
+
+        return sorted(files, key=attrgetter('modified_time'), reverse=True)
+
+    @staticmethod
+    def _report_progress(progress_callback, done: int, added: int) -> None:
+        """Call progress_callback once per newly found file, counting from done."""
+        if progress_callback:
+            for count in range(done + 1, done + added + 1):
+                progress_callback(count)
+
+    def _walk(self, start: str) -> List[FileMetadata]:
+        """
+        Depth-first os.scandir walk below one directory.
 
-        for md_file in root_path.rglob('*.md'):
-            rel_path = str(md_file.relative_to(root_path))
+        Args:
+            start: Directory to walk
 
-            # Skip excluded patterns
-            if self._should_exclude(rel_path):
-                continue
+        Returns:
+            FileMetadata for every markdown file in the subtree
+        """
+        files = []
+        stack = [start]
+        while stack:
+            self._scan_directory(stack.pop(), files, stack)
+        return files
+
+    def _scan_directory(
+        self,
+        directory: str,
+        files: List[FileMetadata],
+        subdirs: List[str],
+        excluded_names: FrozenSet[str] = frozenset()
+    ) -> None:
+        """
+        List one directory, appending its markdown files (other than those
+        whose lowercased name is in excluded_names) to files and each
+        subdirectory to enter to subdirs.
 
-            try:
-                stat_info = md_file.stat()
-                metadata = FileMetadata(
-                    path=str(md_file.absolute()),
-                    name=md_file.name,
+        scandir entries carry their names and type, so no Path objects are
+        built and excluded subtrees are never entered.
+        """
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Skip directories we can't list
+            return
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        # An excluded directory is never entered
+                        if not self._should_exclude_dir(entry.name):
+                            subdirs.append(entry.path)
+                        continue
+
+                    # Skip non-markdown and excluded files
+                    if (not os.path.normcase(entry.name).endswith('.md')
+                            or (excluded_names and entry.name.lower() in excluded_names)):
+                        continue
+
+                    stat_info = entry.stat()
+                except (OSError, PermissionError):
+                    # Skip files we can't read
+                    continue
+
+                files.append(FileMetadata(
+                    path=entry.path,
+                    name=entry.name,
                     created_time=stat_info.st_ctime,
                     modified_time=stat_info.st_mtime,
                     size=stat_info.st_size
-                )
-                files.append(metadata)
-                count += 1
-
-                if progress_callback:
-                    progress_callback(count)
-            except (OSError, PermissionError):
-                # Skip files we can't read
-                continue
-
-        return sorted(files, key=lambda x: x.modified_time, reverse=True)
+                ))
 
     def save_index(self, files: List[FileMetadata]) -> None:
-        """Save file index to JSON."""
-        data = {
+        """
+        Save file index as compact JSON.
+
+        Each file is a row array in INDEX_COLUMNS order rather than an object,
+        so keys are not repeated per file. Rows are encoded and written one at
+        a time, so no second copy of the index is built in memory. The file
+        count and total size are also written to a small summary file.
+        """
+        summary = {
             'indexed_at': datetime.now().isoformat(),
             'file_count': len(files),
-            'files': [f.to_dict() for f in files]
+            'total_size': sum(file.size for file in files)
         }
+        header = jsonio.dumps({
+            'indexed_at': summary['indexed_at'],
+            'file_count': summary['file_count'],
+            'columns': self.INDEX_COLUMNS
+        })
+        row = attrgetter(*self.INDEX_COLUMNS)
+
+        tmp_file = self.index_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            # Reopen the header object to append the files array
+            f.write(header[:-1] + b',"files":[')
+            for i, file in enumerate(files):
+                if i:
+                    f.write(b',')
+                f.write(jsonio.dumps(row(file)))
+            f.write(b']}')
+        os.replace(tmp_file, self.index_file)
+
+        # Written after the index, so a summary older than it is stale
+        self.summary_file.write_bytes(jsonio.dumps(summary))
+
+    def load_summary(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the index summary (indexed_at, file_count, total_size).
+
+        Read from the summary file when it is at least as new as the index,
+        otherwise computed from the full index.
+        """
+        if not self.index_file.exists():
+            return None
 
-        with open(self.index_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        try:
+            summary_time = self.summary_file.stat().st_mtime_ns
+            if summary_time >= self.index_file.stat().st_mtime_ns:
+                return jsonio.loads(self.summary_file.read_bytes())
+        except (OSError, ValueError):
+            pass
+
+        files = self.load_index() or []
+        return {
+            'indexed_at': '',
+            'file_count': len(files),
+            'total_size': sum(file.size for file in files)
+        }
 
     def load_index(self) -> Optional[List[FileMetadata]]:
-        """Load file index from JSON."""
+        """Load file index from JSON (row arrays, or objects from older indexes)."""
         if not self.index_file.exists():
             return None
 
-        with open(self.index_file, 'r') as f:
-            data = json.load(f)
+        data = jsonio.loads(self.index_file.read_bytes())
 
-        return [FileMetadata(**f) for f in data['files']]
+        if 'columns' not in data:
+            return [FileMetadata(**f) for f in data['files']]
+        return [FileMetadata(*f) for f in data['files']]
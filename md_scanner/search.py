@@ -1,37 +1,62 @@
 """
 Search functionality combining semantic and keyword matching.
 """
-from pathlib import Path
-from typing import List, Tuple, Optional
-import re
+from collections import OrderedDict
+from typing import List, Tuple, Optional, Set
+import numpy as np
 from md_scanner.embeddings import EmbeddingEngine
+from md_scanner.keyword_index import KeywordIndex, tokenize
 
 class SearchEngine:
     """Combined semantic and keyword search."""
 
+    # Result lists remembered for repeated searches
+    RESULT_CACHE_SIZE = 512
+
     def __init__(self, embedding_engine: EmbeddingEngine):
         """Initialize with an embedding engine."""
         self.embedding_engine = embedding_engine
+        self.keyword_index = KeywordIndex(embedding_engine.index_dir)
+        self._indexed_paths = None  # file_paths the keyword index was checked against
+        self._results = OrderedDict()  # search arguments -> results, LRU order
+        self._results_paths = None  # file_paths the cached results were computed for
 
     def _extract_keywords(self, query: str) -> List[str]:
         """Extract keywords from query."""
-        # Simple tokenization - split on non-alphanumeric
-        keywords = re.findall(r'\b\w+\b', query.lower())
-        return keywords
+        # Same tokenization as the keyword index - split on non-alphanumeric
+        return tokenize(query)
+
+    def _keyword_index_for(self, file_paths: List[str]) -> KeywordIndex:
+        """
+        Keyword index covering exactly file_paths, loaded from disk or built
+        (and saved) if the stored one was built for other files.
+        """
+        if self._indexed_paths is not file_paths:
+            index = self.keyword_index
+            if index.file_paths != file_paths and (
+                not index.load() or index.file_paths != file_paths
+            ):
+                index.build(file_paths)
+            self._indexed_paths = file_paths
+        return self.keyword_index
 
     def _keyword_search(
         self,
         keywords: List[str],
         file_paths: List[str],
-        top_k: int = 20
+        top_k: int = 20,
+        allowed_paths: Optional[Set[str]] = None
     ) -> List[Tuple[str, float]]:
         """
         Keyword-based search in file names and content.
 
+        Scored from the persistent keyword index rather than by reading files.
+
         Args:
             keywords: List of keywords to search for
             file_paths: List of files to search
             top_k: Max results
+            allowed_paths: If given, only these files can match
 
         Returns:
             List of (file_path, relevance_score) tuples
@@ -39,47 +64,46 @@ class SearchEngine:
         if not keywords:
             return []
 
-        scores = {}
-        for file_path in file_paths:
-            score = 0.0
-            file_name = Path(file_path).name.lower()
-
-            # Filename matches get higher weight
-            for keyword in keywords:
-                if keyword in file_name:
-                    score += 2.0
-
-            # Try to match in file content
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read(5000).lower()
-                    for keyword in keywords:
-                        count = content.count(keyword)
-                        if count > 0:
-                            score += min(count, 5)
-            except Exception:
-                pass
-
-            if score > 0:
-                scores[file_path] = score
-
-        # Sort by score and return top_k
-        sorted_results = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return [(path, float(score)) for path, score in sorted_results[:top_k]]
+        scores = self._keyword_index_for(file_paths).score(keywords)
+        if allowed_paths is not None:
+            allowed = np.fromiter(
+                (path in allowed_paths for path in file_paths),
+                dtype=bool,
+                count=len(file_paths)
+            )
+            scores[~allowed] = 0.0
+
+        matches = np.flatnonzero(scores)
+
+        # Keep only files scoring at least the top_k-th best score (O(N)
+        # partition), so just those are sorted; all ties at that score stay
+        if 0 < top_k < len(matches):
+            cut = len(matches) - top_k
+            threshold = np.partition(scores[matches], cut)[cut]
+            matches = matches[scores[matches] >= threshold]
+
+        # Sort by score (ties keep file order) and return top_k
+        top = matches[np.argsort(-scores[matches], kind='stable')][:top_k]
+        return [(file_paths[i], float(scores[i])) for i in top]
 
     def search(
         self,
         query: str,
         semantic_weight: float = 0.7,
-        top_k: int = 15
+        top_k: int = 15,
+        allowed_paths: Optional[Set[str]] = None
     ) -> List[Tuple[str, float]]:
         """
         Combined semantic + keyword search.
 
+        Results of recent searches are remembered until the embeddings are
+        regenerated or reloaded.
+
         Args:
             query: Search query
             semantic_weight: Weight for semantic similarity (0.0-1.0)
             top_k: Number of results to return
+            allowed_paths: If given, only these files are scored and returned
 
         Returns:
             List of (file_path, combined_score) tuples
@@ -87,33 +111,43 @@ class SearchEngine:
         if not self.embedding_engine.file_paths:
             return []
 
+        # Cached results are only valid for the embeddings they came from
+        if self._results_paths is not self.embedding_engine.file_paths:
+            self._results.clear()
+            self._results_paths = self.embedding_engine.file_paths
+
+        allowed_key = None if allowed_paths is None else frozenset(allowed_paths)
+        key = (query, semantic_weight, top_k, allowed_key)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return list(cached)
+
         keyword_weight = 1.0 - semantic_weight
 
         # Get results from both search methods
-        semantic_results = self.embedding_engine.search(query, top_k=top_k * 2)
+        semantic_results = self.embedding_engine.search(
+            query, top_k=top_k * 2, allowed_paths=allowed_paths
+        )
         keywords = self._extract_keywords(query)
         keyword_results = self._keyword_search(
             keywords,
             self.embedding_engine.file_paths,
-            top_k=top_k * 2
+            top_k=top_k * 2,
+            allowed_paths=allowed_paths
         )
 
-        # Combine scores
-        combined_scores = {}
+        # Combine scores; semantic results are unique paths, so they seed
+        # the dict and keyword scores are added on top
+        combined_scores = {
+            file_path: score * semantic_weight
+            for file_path, score in semantic_results
+        }
 
-        # Add semantic results
-        for i, (file_path, score) in enumerate(semantic_results):
-            # Normalize semantic score
-            combined_scores[file_path] = score * semantic_weight
-
-        # Add keyword results
+        # Normalize keyword scores (capped at 10 -> 0-1 range) and add them
         for file_path, keyword_score in keyword_results:
-            # Normalize keyword score (0-2 range -> 0-1 range)
-            normalized_keyword_score = min(1.0, keyword_score / 10.0)
-            if file_path in combined_scores:
-                combined_scores[file_path] += normalized_keyword_score * keyword_weight
-            else:
-                combined_scores[file_path] = normalized_keyword_score * keyword_weight
+            weighted = min(1.0, keyword_score / 10.0) * keyword_weight
+            combined_scores[file_path] = combined_scores.get(file_path, 0.0) + weighted
 
         # Sort and return top results
         sorted_results = sorted(
@@ -121,7 +155,11 @@ class SearchEngine:
             key=lambda x: x[1],
             reverse=True
         )
-        return sorted_results[:top_k]
+        results = sorted_results[:top_k]
+        self._results[key] = results
+        if len(self._results) > self.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return list(results)
 
     def search_in_cluster(
         self,
@@ -140,14 +178,5 @@ class SearchEngine:
         Returns:
             List of (file_path, score) tuples
         """
-        # Get global search results
-        all_results = self.search(query, top_k=len(cluster_files))
-
-        # Filter to only cluster files
-        cluster_set = set(cluster_files)
-        filtered_results = [
-            (path, score) for path, score in all_results
-            if path in cluster_set
-        ]
-
-        return filtered_results[:top_k]
+        # Rank only the cluster's files rather than filtering a global ranking
+        return self.search(query, top_k=top_k, allowed_paths=set(cluster_files))
@@ -0,0 +1,66 @@
+"""
+Numba kernels for similarity search.
+
+Importing this module requires numba; EmbeddingEngine treats ImportError
+as "kernels unavailable" and falls back to numpy argpartition.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _sift_down(val: np.ndarray, idx: np.ndarray, pos: int, size: int) -> None:
+    """Restore the min-heap property below pos."""
+    while True:
+        smallest = pos
+        left = 2 * pos + 1
+        right = left + 1
+        if left < size and val[left] < val[smallest]:
+            smallest = left
+        if right < size and val[right] < val[smallest]:
+            smallest = right
+        if smallest == pos:
+            return
+        val[pos], val[smallest] = val[smallest], val[pos]
+        idx[pos], idx[smallest] = idx[smallest], idx[pos]
+        pos = smallest
+
+
+@njit(cache=True)
+def topk(scores: np.ndarray, k: int):
+    """
+    Select the k highest scores in a single pass.
+
+    Keeps a size-k min-heap of the best scores seen so far; most elements
+    are rejected by one comparison against the heap root.
+
+    Args:
+        scores: (N,) similarity scores
+        k: Number of results (clamped to N)
+
+    Returns:
+        Tuple of (indices, values), sorted by descending score
+    """
+    n = scores.shape[0]
+    k = min(k, n)
+    idx = np.empty(k, np.int64)
+    val = np.empty(k, scores.dtype)
+
+    for i in range(k):
+        idx[i] = i
+        val[i] = scores[i]
+    for pos in range(k // 2 - 1, -1, -1):
+        _sift_down(val, idx, pos, k)
+
+    for i in range(k, n):
+        if scores[i] > val[0]:
+            val[0] = scores[i]
+            idx[0] = i
+            _sift_down(val, idx, 0, k)
+
+    order = np.argsort(-val)
+    return idx[order], val[order]
+
+
+# Compile (or load from cache) when first imported, ahead of the first real query
+topk(np.zeros(4, dtype=np.float32), 2)
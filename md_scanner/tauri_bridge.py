@@ -7,17 +7,18 @@ Receives JSON commands from Rust and calls Python engines accordingly.
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable, Tuple, TYPE_CHECKING
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from md_scanner.scanner import FileScanner
-from md_scanner.embeddings import EmbeddingEngine
-from md_scanner.clustering import ClusteringEngine
-from md_scanner.search import SearchEngine
-from md_scanner.timeline import TimelineEngine
-from md_scanner.learning import AdaptiveCoach
+from md_scanner import jsonio
+
+# Engines are imported by the handlers that use them, so light commands
+# (stats, validation, system info) don't pay for numpy, numba or sklearn
+if TYPE_CHECKING:
+    from md_scanner.learning import AdaptiveCoach
+    from md_scanner.search import SearchEngine
 
 
 class TauriBridge:
@@ -28,7 +29,17 @@ class TauriBridge:
         self.embedding_engine = None
         self.cluster_engine = None
         self.search_engine = None
-        self.coach = AdaptiveCoach()
+        self._coach = None
+        # index_dir -> (embeddings mtime, SearchEngine), reused across commands
+        self._search_engines: Dict[str, Tuple[int, "SearchEngine"]] = {}
+
+    @property
+    def coach(self) -> "AdaptiveCoach":
+        """Adaptive coach, created by the first coaching command."""
+        if self._coach is None:
+            from md_scanner.learning import AdaptiveCoach
+            self._coach = AdaptiveCoach()
+        return self._coach
 
     def handle_command(self, method: str, args: Dict[str, Any]) -> Dict[str, Any]:
         """Route command to appropriate handler."""
@@ -49,6 +60,7 @@ class TauriBridge:
         progress_callback: Optional[Callable] = None,
     ) -> Dict[str, Any]:
         """Scan a directory and create index."""
+        from md_scanner.scanner import FileScanner
         self.scan_engine = FileScanner(index_dir)
         result = self.scan_engine.scan(path)
         
@@ -64,6 +76,7 @@ class TauriBridge:
         progress_callback: Optional[Callable] = None,
     ) -> Dict[str, Any]:
         """Generate embeddings for indexed files."""
+        from md_scanner.embeddings import EmbeddingEngine
         self.embedding_engine = EmbeddingEngine(index_dir)
         cached, generated = self.embedding_engine.generate()
         
@@ -79,6 +92,7 @@ class TauriBridge:
         progress_callback: Optional[Callable] = None,
     ) -> Dict[str, Any]:
         """Create clusters from embeddings."""
+        from md_scanner.clustering import ClusteringEngine
         self.cluster_engine = ClusteringEngine(index_dir)
         
         if num_clusters is None:
@@ -100,20 +114,46 @@ class TauriBridge:
         semantic_weight: float = 0.7,
     ) -> Dict[str, Any]:
         """Search index with query."""
-        self.search_engine = SearchEngine(index_dir)
+        self.search_engine = self._search_engine_for(index_dir)
         results = self.search_engine.search(
             query, top_k=top_k, semantic_weight=semantic_weight
         )
         
         return results
 
+    def _search_engine_for(self, index_dir: str) -> "SearchEngine":
+        """
+        Search engine over index_dir's embeddings, kept between commands so
+        the model and embeddings load once per process. Rebuilt when the
+        embeddings file changes.
+        """
+        from md_scanner.embeddings import EmbeddingEngine
+        from md_scanner.search import SearchEngine
+
+        embedding_engine = EmbeddingEngine(index_dir=index_dir)
+        if not embedding_engine.embeddings_file.exists():
+            raise ValueError("Embeddings not found. Generate embeddings first.")
+        mtime = embedding_engine.embeddings_file.stat().st_mtime_ns
+
+        cached = self._search_engines.get(index_dir)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        if not embedding_engine.load_embeddings():
+            raise ValueError("Embeddings not found. Generate embeddings first.")
+        search_engine = SearchEngine(embedding_engine)
+        self._search_engines[index_dir] = (mtime, search_engine)
+        return search_engine
+
     def _get_clusters_summary(self, index_dir: str) -> Dict[str, Any]:
         """Get clusters summary."""
+        from md_scanner.clustering import ClusteringEngine
         self.cluster_engine = ClusteringEngine(index_dir)
         return self.cluster_engine.get_summary()
 
     def _get_timeline(self, index_dir: str, days: int = 30) -> Dict[str, Any]:
         """Get timeline data."""
+        from md_scanner.timeline import TimelineEngine
         timeline = TimelineEngine(index_dir)
         return timeline.get_timeline(days)
 
@@ -121,7 +161,7 @@ class TauriBridge:
         """Get index statistics."""
         index_path = Path(index_dir)
         files_json = index_path / "files.json"
-        embeddings_pkl = index_path / "embeddings.pkl"
+        embeddings_npy = index_path / "embeddings.npy"
         clusters_json = index_path / "clusters.json"
         
         total_files = 0
@@ -130,23 +170,18 @@ class TauriBridge:
         cluster_count = 0
         
         if files_json.exists():
-            import json as json_module
-            with open(files_json) as f:
-                data = json_module.load(f)
-                total_files = len(data.get("files", []))
-                total_size = sum(f.get("size", 0) for f in data.get("files", []))
+            from md_scanner.scanner import FileScanner
+            summary = FileScanner(index_dir).load_summary() or {}
+            total_files = summary.get("file_count", 0)
+            total_size = summary.get("total_size", 0)
         
-        if embeddings_pkl.exists():
-            import pickle
-            with open(embeddings_pkl, "rb") as f:
-                data = pickle.load(f)
-                embeddings_count = len(data.get("embeddings", {}))
+        if embeddings_npy.exists():
+            from md_scanner.embeddings import EmbeddingEngine
+            embeddings_count = EmbeddingEngine(index_dir=index_dir).stored_count()
         
         if clusters_json.exists():
-            import json as json_module
-            with open(clusters_json) as f:
-                data = json_module.load(f)
-                cluster_count = len(data.get("clusters", []))
+            data = jsonio.loads(clusters_json.read_bytes())
+            cluster_count = len(data.get("clusters", []))
         
         return {
             "total_files": total_files,
@@ -162,7 +197,7 @@ class TauriBridge:
         index_path = Path(index_dir)
         
         has_files = (index_path / "files.json").exists()
-        has_embeddings = (index_path / "embeddings.pkl").exists()
+        has_embeddings = (index_path / "embeddings.npy").exists()
         has_clusters = (index_path / "clusters.json").exists()
         
         index_valid = has_files  # At minimum, need scanned files
@@ -217,9 +252,8 @@ class TauriBridge:
         file_path: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Get naming suggestion with fade-out logic."""
-        from dataclasses import asdict
         result = self.coach.get_naming_suggestion(filename, content, file_path)
-        return asdict(result)
+        return result.to_dict()
 
     def _coach_get_folder_suggestion(
         self,
@@ -227,9 +261,8 @@ class TauriBridge:
         available_folders: Optional[list] = None,
     ) -> Dict[str, Any]:
         """Get folder suggestion with fade-out logic."""
-        from dataclasses import asdict
         result = self.coach.get_folder_suggestion(file_path, available_folders)
-        return asdict(result)
+        return result.to_dict()
 
     def _coach_get_search_tip(
         self,
@@ -288,29 +321,78 @@ class TauriBridge:
         return {"reengaged": True, "skill": skill_name}
 
 
+def _encode_response(result: Dict[str, Any]) -> bytes:
+    """Encode a command result as JSON bytes, or an error if it can't be."""
+    try:
+        return jsonio.dumps(result)
+    except TypeError:
+        pass
+
+    try:
+        # orjson rejects non-string dict keys, which json converts
+        return json.dumps(result).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        return jsonio.dumps({
+            "error": f"Result is not JSON serializable: {e}",
+            "success": False,
+        })
+
+
+def _run_command(bridge: TauriBridge, data: bytes) -> bytes:
+    """Decode one JSON command, run it and encode the response."""
+    command = jsonio.loads(data)
+    method = command.get("method")
+    args = command.get("args", {})
+    return _encode_response(bridge.handle_command(method, args))
+
+
 def main():
-    """Main entry point for subprocess communication."""
+    """
+    Main entry point for subprocess communication.
+
+    By default reads a single JSON command from stdin and writes its JSON
+    response to stdout; a command that can't be read is reported on stderr
+    with exit status 1.
+
+    With --serve, reads one JSON command per line and writes one response
+    line per command until stdin closes, so a long-lived caller reuses the
+    loaded engines. Unreadable commands get an error response instead of
+    ending the process.
+    """
     bridge = TauriBridge()
-    
-    try:
-        # Read JSON command from stdin
-        input_data = sys.stdin.read()
-        command = json.loads(input_data)
-        
-        method = command.get("method")
-        args = command.get("args", {})
-        
-        result = bridge.handle_command(method, args)
-        
+
+    # Commands and responses are UTF-8 JSON bytes, decoded and encoded by
+    # orjson when it is installed
+    if "--serve" not in sys.argv[1:]:
+        try:
+            response = _run_command(bridge, sys.stdin.buffer.read())
+        except Exception as e:
+            error_response = {
+                "error": str(e),
+                "success": False,
+            }
+            print(json.dumps(error_response), file=sys.stderr)
+            sys.exit(1)
+
         # Write result to stdout
-        print(json.dumps(result))
-    except Exception as e:
-        error_response = {
-            "error": str(e),
-            "success": False,
-        }
-        print(json.dumps(error_response), file=sys.stderr)
-        sys.exit(1)
+        sys.stdout.buffer.write(response + b"\n")
+        sys.stdout.flush()
+        return
+
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+
+        try:
+            response = _run_command(bridge, line)
+        except Exception as e:
+            response = _encode_response({
+                "error": str(e),
+                "success": False,
+            })
+
+        sys.stdout.buffer.write(response + b"\n")
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -22,11 +22,25 @@ class TimelineEngine:
         """Initialize timeline engine."""
         self.files = None
         self.clusters = None
+        self._paths = None  # (N,) object array of paths aligned with files
+        self._mtimes = None  # (N,) float64 modified times aligned with files
+        self._by_mtime = None  # (N,) file indices, oldest first (ties in file order)
+        self._sorted_mtimes = None  # (N,) _mtimes[_by_mtime], ascending
 
     def set_data(self, files: List[FileMetadata], clusters: Optional[Dict] = None):
         """Set file metadata and optional cluster data."""
         self.files = files
         self.clusters = clusters
+        self._paths = np.array(
+            [file_meta.path for file_meta in files or ()], dtype=object
+        )
+        self._mtimes = np.fromiter(
+            (file_meta.modified_time for file_meta in files or ()),
+            dtype=np.float64
+        )
+        # Sorted once so age cutoffs are found by binary search
+        self._by_mtime = np.argsort(self._mtimes, kind='stable')
+        self._sorted_mtimes = self._mtimes[self._by_mtime]
 
     def get_recency_bucket(self, timestamp: float) -> str:
         """Determine which time bucket a file falls into."""
@@ -55,30 +69,52 @@ class TimelineEngine:
         now = datetime.now().timestamp()
         cutoff = now - (days * 86400)
 
-        timeline = {}
-        for file_meta in self.files:
-            if file_meta.modified_time >= cutoff:
-                date_str = datetime.fromtimestamp(
-                    file_meta.modified_time
-                ).strftime('%Y-%m-%d')
-
-                if date_str not in timeline:
-                    timeline[date_str] = []
-                timeline[date_str].append(file_meta.path)
-
-        return dict(sorted(timeline.items(), reverse=True))
+        # Recent files are a suffix of the mtime order; restore file order
+        start = np.searchsorted(self._sorted_mtimes, cutoff, side='left')
+        indices = np.sort(self._by_mtime[start:])
+        if not len(indices):
+            return {}
+        mtimes = self._mtimes[indices]
+
+        # Local midnights from the oldest to the newest day; each file's day
+        # is the last midnight at or before its modified time
+        first = datetime.fromtimestamp(mtimes.min()).date()
+        last = datetime.fromtimestamp(mtimes.max()).date()
+        dates = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        midnights = np.array(
+            [datetime.combine(date, datetime.min.time()).timestamp() for date in dates]
+        )
+        day_of_file = np.searchsorted(midnights, mtimes, side='right') - 1
+
+        # Group by day (files keep their order within a day), newest day first
+        order = np.argsort(day_of_file, kind='stable')
+        days_present, starts = np.unique(day_of_file[order], return_index=True)
+        groups = np.split(self._paths[indices[order]], starts[1:])
+
+        return {
+            dates[day].strftime('%Y-%m-%d'): group.tolist()
+            for day, group in zip(days_present[::-1], groups[::-1])
+        }
 
     def get_bucket_summary(self) -> Dict[str, int]:
         """Get count of files in each time bucket."""
         if not self.files:
             return {}
 
-        buckets = {name: 0 for name, _ in self.TIME_BUCKETS}
-        for file_meta in self.files:
-            bucket = self.get_recency_bucket(file_meta.modified_time)
-            buckets[bucket] += 1
+        now = datetime.now().timestamp()
+        ages = (now - self._mtimes) / 86400
+
+        # Index of the first bucket with age <= max_days; ages beyond the
+        # last bound land past the end and are counted as archived
+        bounds = np.array(
+            [max_days for _, max_days in self.TIME_BUCKETS], dtype=np.float64
+        )
+        indices = np.minimum(np.digitize(ages, bounds, right=True), len(bounds) - 1)
+        counts = np.bincount(indices, minlength=len(bounds))
 
-        return buckets
+        return {
+            name: int(count) for (name, _), count in zip(self.TIME_BUCKETS, counts)
+        }
 
     def find_aged_files(self, days_threshold: int = 180) -> List[Tuple[str, float]]:
         """
@@ -96,13 +132,13 @@ class TimelineEngine:
         now = datetime.now().timestamp()
         cutoff = now - (days_threshold * 86400)
 
-        old_files = []
-        for file_meta in self.files:
-            if file_meta.modified_time < cutoff:
-                age_days = (now - file_meta.modified_time) / 86400
-                old_files.append((file_meta.path, age_days))
+        # Aged files are a prefix of the mtime order, already oldest first
+        # (files with equal modified times keep their order)
+        count = np.searchsorted(self._sorted_mtimes, cutoff, side='left')
+        indices = self._by_mtime[:count]
+        ages = (now - self._mtimes[indices]) / 86400
 
-        return sorted(old_files, key=lambda x: x[1], reverse=True)
+        return list(zip(self._paths[indices].tolist(), ages.tolist()))
 
     def get_project_evolution(self, cluster_id: Optional[int] = None) -> Dict[str, int]:
         """
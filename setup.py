@@ -12,6 +12,7 @@ setup(
         "sentence-transformers>=2.2.0",
         "numpy>=1.21.0",
         "scikit-learn>=1.0.0",
+        "scipy>=1.7.0",
         "click>=8.0.0",
         "pydantic>=1.9.0",
         "tqdm>=4.60.0",